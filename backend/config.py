@@ -58,9 +58,93 @@ GRAPH_CONFIG = {
     'width': 1200,
     'height': 600,
     'line_width': 2.5,
-    'original_color': '#ffa726'
+    'original_color': '#ffa726',
+    'fast_spec': True  # graph_objects 검증 없이 Plotly JSON 스펙 직접 생성
 }
 
 # 출력 설정
 OUTPUT_DIR = 'docs'
 OUTPUT_FILENAME = 'index.html'
+
+# 시계열 저장소 설정 (memmap 기반 통화쌍별 바이너리 파일)
+STORE_DIR = 'data/store'
+STORE_PRICE_DTYPE = 'float64'  # 'float64' 또는 'float32'
+STORE_START_TOLERANCE_DAYS = 31  # 저장소 첫 날짜가 필요 시작일보다 이만큼 늦어도 증분 수집
+STORE_TIME_UNIT = 'D'  # 새 파일의 Date 저장 단위 ('D' 일봉, 'm'/'s'/'ms' 분봉 등 장중 데이터)
+
+# 다해상도 피라미드 설정 (세밀한 순서, 값은 pandas resample 주기)
+PYRAMID_LEVELS = {
+    'daily': None,
+    'weekly': 'W-FRI',
+    'monthly': 'MS'
+}
+PYRAMID_MAX_POINTS = 400  # 확대 시 화면 범위에 표시할 최대 포인트 수
+
+# 파이프라인 설정 (수집/분석/렌더링 단계 동시 실행)
+PIPELINE_CONFIG = {
+    'queue_size': 4,  # 단계 사이 큐 최대 크기 (backpressure)
+    'fetch_workers': 2,  # 네트워크 I/O 단계
+    'analyze_workers': 1,
+    'render_workers': 1
+}
+
+# 이동 구간 백분위 / z-score 설정 (컬럼: PCT{name}, ZSCORE{name})
+PERCENTILE_WINDOWS = {
+    '1Y': 250,
+    '3Y': 750
+}
+
+# 리스크 지표 설정
+RISK_CONFIG = {
+    'volatility_window': 60,  # 연율화 변동성 구간 (거래일)
+    'var_window': 250,  # 역사적 VaR 구간 (거래일)
+    'var_confidence': 0.95,
+    'periods_per_year': 250
+}
+
+# 알림 설정 (python main.py --live 실행 중 신규 데이터마다 평가)
+ALERT_CONFIG = {
+    'log_path': 'data/alerts.jsonl',  # JSON Lines 기록 경로 (None이면 기록 안 함)
+    'udp': None,  # ('127.0.0.1', 9999) 지정 시 UDP로도 전송
+    # 모든 통화쌍 공통 규칙 (종류, 값): level=가격, ma_cross=이동평균명, breakout=최고/최저 경신, daily_move=일간 변동률 %
+    'default_rules': [
+        ('ma_cross', 'MA1Y'),
+        ('breakout', None),
+        ('daily_move', 1.5)
+    ],
+    # 통화쌍별 추가 규칙
+    'rules': {
+        'USD/KRW': [('level', 1400.0)]
+    }
+}
+
+# 분석 결과 내보내기 설정 (Arrow IPC / Parquet, 통화쌍별 파티션)
+EXPORT_DIR = 'data/export'
+EXPORT_FORMATS = ('arrow', 'parquet')
+
+# 실시간 갱신 서버 설정 (python main.py --live)
+LIVE_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8765,
+    'min_interval': 1.0,  # 클라이언트별 최소 전송 간격 (초)
+    'poll_interval': 60.0  # 신규 데이터 조회 간격 (초)
+}
+
+# 분산 워커 설정 (python main.py --worker / --assemble, 공유 파일시스템 경로)
+SHARD_CONFIG = {
+    'db_path': 'data/shards/leases.db',  # SQLite lease 테이블
+    'fragment_dir': 'data/shards/fragments',  # 워커가 만든 통화별 HTML 조각
+    'lease_seconds': 300,  # lease 만료 시간 (초), 만료 시 다른 워커가 재할당
+    'max_attempts': 3
+}
+
+# 청크 분석 설정 (python main.py --chunked, 저장소 이력을 청크 단위로 분석해 내보내기)
+CHUNK_SIZE = 100000  # 청크당 레코드 수
+CHUNK_STORE_DIR = STORE_DIR  # 분석할 저장소 (분봉 저장소는 time_unit='m' 등으로 기록한 디렉토리 지정, 이동평균 기간은 봉 개수)
+
+# 전체 통화 개요 페이지 설정 (정렬 표 + 스파크라인, 차트는 클릭 시 로드)
+OVERVIEW_CONFIG = {
+    'filename': 'overview.html',
+    'chart_dir': 'charts',  # OUTPUT_DIR 기준 통화별 차트 스크립트(.js) 디렉토리
+    'sparkline': {'width': 120, 'height': 28, 'points': 60}
+}
@@ -0,0 +1,362 @@
+"""
+알림 모듈
+통화쌍별 증분 상태를 유지하며 새 데이터마다 임계값/이동평균 돌파/급변동 알림 평가
+"""
+
+import json
+import socket
+import threading
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+
+# 지원 규칙 종류
+RULE_TYPES = ('level', 'ma_cross', 'breakout', 'daily_move')
+
+
+class FileAlertSink:
+    """알림을 JSON Lines 파일에 추가 기록"""
+
+    def __init__(self, path: str):
+        """
+        초기화
+
+        Args:
+            path: 출력 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict):
+        """알림 기록"""
+        line = json.dumps(event, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class CallbackAlertSink:
+    """알림을 콜백 함수로 전달"""
+
+    def __init__(self, callback: Callable[[Dict], None]):
+        """
+        초기화
+
+        Args:
+            callback: 알림 dict를 받는 함수
+        """
+        self.callback = callback
+
+    def emit(self, event: Dict):
+        """알림 전달"""
+        self.callback(event)
+
+
+class SocketAlertSink:
+    """알림을 로컬 UDP 소켓으로 전송 (JSON 데이터그램)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 9999):
+        """
+        초기화
+
+        Args:
+            host: 수신 호스트
+            port: 수신 포트
+        """
+        self.address = (host, port)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def emit(self, event: Dict):
+        """알림 전송"""
+        self._sock.sendto(json.dumps(event, ensure_ascii=False).encode('utf-8'), self.address)
+
+    def close(self):
+        """소켓 닫기"""
+        self._sock.close()
+
+
+class _PairState:
+    """통화쌍별 증분 상태"""
+
+    def __init__(self, ma_periods: Dict[str, int], extreme_days: int):
+        self.ma_windows = {name: deque(maxlen=period) for name, period in ma_periods.items()}
+        self.ma_sums = {name: 0.0 for name in ma_periods}
+        self.ma_values = {name: None for name in ma_periods}
+
+        # 구간 최고/최저 (단조 deque: (날짜, 가격)), get_statistics와 같은 달력 기준 구간
+        self.extreme_span = timedelta(days=extreme_days)
+        self.max_queue = deque()
+        self.min_queue = deque()
+
+        self.last_price = None
+        self.last_date = None
+
+        # 규칙 인덱스
+        self.levels = []  # 정렬된 가격
+        self.level_ids = []  # levels와 같은 순서의 rule_id
+        self.move_thresholds = []  # 정렬된 변동률 (%)
+        self.move_ids = []  # move_thresholds와 같은 순서의 rule_id
+        self.ma_rules = {}  # {ma_name: [rule_id]}
+        self.breakout_rules = []  # [rule_id]
+
+    def push(self, date: pd.Timestamp, price: float):
+        """가격 추가 후 이동평균 / 구간 극값 갱신"""
+        for name, window in self.ma_windows.items():
+            if len(window) == window.maxlen:
+                self.ma_sums[name] -= window[0]
+            window.append(price)
+            self.ma_sums[name] += price
+            self.ma_values[name] = self.ma_sums[name] / len(window)
+
+        while self.max_queue and self.max_queue[-1][1] <= price:
+            self.max_queue.pop()
+        self.max_queue.append((date, price))
+        while self.min_queue and self.min_queue[-1][1] >= price:
+            self.min_queue.pop()
+        self.min_queue.append((date, price))
+
+        # 구간 시작일 (최신일 - 기간) 이전 항목 제거
+        cutoff = date - self.extreme_span
+        while self.max_queue[0][0] < cutoff:
+            self.max_queue.popleft()
+        while self.min_queue[0][0] < cutoff:
+            self.min_queue.popleft()
+
+        self.last_price = price
+        self.last_date = date
+
+
+class FXAlertEngine:
+    """
+    다중 통화 알림 엔진
+
+    통화쌍마다 이동평균 누적합, 구간 최고/최저 단조 deque, 정렬된 임계값 인덱스를 유지하므로
+    새 데이터 1건 평가 비용은 O(이동평균 수 + log 규칙 수 + 발생 알림 수)이다.
+    마지막 처리일 이전이거나 같은 날짜의 데이터는 무시하므로 같은 봉을 다시 보내도 상태가 변하지 않는다.
+
+    규칙 종류:
+        - level: 가격이 지정 가격을 상향/하향 돌파 (value=가격)
+        - ma_cross: 가격이 이동평균을 상향/하향 돌파 (value=이동평균명, 예: 'MA1Y')
+        - breakout: 가격이 구간 최고/최저 경신 (value 없음)
+        - daily_move: 일간 변동률 절대값이 value%를 초과
+    """
+
+    def __init__(
+        self,
+        ma_periods: Dict[str, int],
+        sinks: Optional[List] = None,
+        extreme_days: int = 5 * 365
+    ):
+        """
+        초기화
+
+        Args:
+            ma_periods: 이동평균 기간 딕셔너리 {'MA3M': 60, 'MA1Y': 250, ...}
+            sinks: emit(event) 메서드를 가진 알림 출력 목록
+            extreme_days: 최고/최저 판단 구간 (달력 일수, get_statistics 표시 기간과 동일하게 설정)
+        """
+        self.ma_periods = dict(ma_periods)
+        self.sinks = list(sinks or [])
+        self.extreme_days = extreme_days
+        self.states = {}
+        self._next_rule_id = 0
+
+    def _state(self, currency_code: str) -> _PairState:
+        """통화쌍 상태 조회 (없으면 생성)"""
+        state = self.states.get(currency_code)
+        if state is None:
+            state = _PairState(self.ma_periods, self.extreme_days)
+            self.states[currency_code] = state
+        return state
+
+    def add_rule(
+        self,
+        currency_code: str,
+        rule_type: str,
+        value=None,
+        rule_id: Optional[str] = None
+    ) -> str:
+        """
+        알림 규칙 등록
+
+        Args:
+            currency_code: 통화 코드
+            rule_type: 규칙 종류 (RULE_TYPES)
+            value: 규칙 값 (가격, 이동평균명, 변동률 %)
+            rule_id: 규칙 식별자, None이면 자동 생성
+
+        Returns:
+            str: 규칙 식별자
+        """
+        if rule_type not in RULE_TYPES:
+            raise ValueError(f"Unknown rule type: {rule_type}")
+
+        if rule_id is None:
+            rule_id = f"{rule_type}-{self._next_rule_id}"
+            self._next_rule_id += 1
+
+        state = self._state(currency_code)
+        if rule_type == 'level':
+            idx = bisect_right(state.levels, float(value))
+            state.levels.insert(idx, float(value))
+            state.level_ids.insert(idx, rule_id)
+        elif rule_type == 'daily_move':
+            idx = bisect_right(state.move_thresholds, abs(float(value)))
+            state.move_thresholds.insert(idx, abs(float(value)))
+            state.move_ids.insert(idx, rule_id)
+        elif rule_type == 'ma_cross':
+            if value not in self.ma_periods:
+                raise ValueError(f"Unknown moving average: {value}")
+            state.ma_rules.setdefault(value, []).append(rule_id)
+        else:
+            state.breakout_rules.append(rule_id)
+
+        return rule_id
+
+    def initialize(
+        self,
+        currency_code: str,
+        df: pd.DataFrame,
+        price_column: str = 'Close'
+    ):
+        """
+        과거 데이터로 증분 상태 초기화 (알림 발생 없음)
+
+        Args:
+            currency_code: 통화 코드
+            df: 환율 데이터프레임 (Date 기준 정렬)
+            price_column: 가격 컬럼명
+        """
+        state = self._state(currency_code)
+        if df.empty:
+            return
+
+        # 이동평균 기간 또는 최고/최저 구간 중 긴 쪽만큼 재생
+        dates = pd.to_datetime(df['Date'])
+        cutoff = dates.iloc[-1] - timedelta(days=self.extreme_days)
+        start = min(int(dates.searchsorted(cutoff, side='left')), max(0, len(df) - max(self.ma_periods.values(), default=1)))
+        if state.last_date is not None:
+            start = max(start, int(dates.searchsorted(state.last_date, side='right')))
+
+        prices = df[price_column].to_numpy(dtype=float)
+        for i in range(start, len(df)):
+            state.push(dates.iloc[i], float(prices[i]))
+
+    def update(self, currency_code: str, date, price: float) -> List[Dict]:
+        """
+        새 데이터 1건 평가
+
+        Args:
+            currency_code: 통화 코드
+            date: 날짜
+            price: 가격
+
+        Returns:
+            list: 발생한 알림 목록 (sink에도 전달됨), 마지막 처리일 이전/같은 날짜면 빈 목록
+        """
+        state = self._state(currency_code)
+        date = pd.Timestamp(date)
+        if state.last_date is not None and date <= state.last_date:
+            return []
+
+        price = float(price)
+        prev_price = state.last_price
+        prev_ma = dict(state.ma_values) if state.ma_rules else None
+        prev_high = state.max_queue[0][1] if state.max_queue else None
+        prev_low = state.min_queue[0][1] if state.min_queue else None
+
+        state.push(date, price)
+
+        # (rule_id, 종류, 방향, 기준값, 추가 정보) - 알림 dict는 발생 시에만 생성
+        hits = []
+
+        if prev_price is not None:
+            # 지정 가격 돌파 (정렬 인덱스 구간 탐색)
+            if price > prev_price:
+                lo = bisect_right(state.levels, prev_price)
+                hi = bisect_right(state.levels, price)
+                for i in range(lo, hi):
+                    hits.append((state.level_ids[i], 'level', 'up', state.levels[i], None))
+            elif price < prev_price:
+                lo = bisect_left(state.levels, price)
+                hi = bisect_left(state.levels, prev_price)
+                for i in range(lo, hi):
+                    hits.append((state.level_ids[i], 'level', 'down', state.levels[i], None))
+
+            # 일간 변동률
+            change = (price / prev_price - 1) * 100
+            hi = bisect_left(state.move_thresholds, abs(change))
+            direction = 'up' if change > 0 else 'down'
+            for i in range(hi):
+                hits.append((state.move_ids[i], 'daily_move', direction, state.move_thresholds[i], {'change': change}))
+
+            # 이동평균 돌파
+            for ma_name, rule_ids in state.ma_rules.items():
+                before = prev_ma[ma_name]
+                after = state.ma_values[ma_name]
+                if before is None:
+                    continue
+                if prev_price <= before and price > after:
+                    direction = 'up'
+                elif prev_price >= before and price < after:
+                    direction = 'down'
+                else:
+                    continue
+                for rule_id in rule_ids:
+                    hits.append((rule_id, 'ma_cross', direction, after, {'ma': ma_name}))
+
+        # 구간 최고/최저 경신
+        if state.breakout_rules and prev_high is not None:
+            if price > prev_high:
+                for rule_id in state.breakout_rules:
+                    hits.append((rule_id, 'breakout', 'up', prev_high, None))
+            elif price < prev_low:
+                for rule_id in state.breakout_rules:
+                    hits.append((rule_id, 'breakout', 'down', prev_low, None))
+
+        if not hits:
+            return []
+
+        formatted_date = date.strftime('%Y-%m-%d')
+        events = []
+        for rule_id, rule_type, direction, reference, extra in hits:
+            event = {
+                'currency': currency_code,
+                'date': formatted_date,
+                'rule_id': rule_id,
+                'type': rule_type,
+                'direction': direction,
+                'price': price,
+                'reference': reference
+            }
+            if extra:
+                event.update(extra)
+            events.append(event)
+
+            for sink in self.sinks:
+                sink.emit(event)
+
+        return events
+
+    def get_state(self, currency_code: str) -> Dict:
+        """
+        통화쌍 현재 상태 조회
+
+        Args:
+            currency_code: 통화 코드
+
+        Returns:
+            dict: 최근 가격, 이동평균, 구간 최고/최저
+        """
+        state = self._state(currency_code)
+        return {
+            'price': state.last_price,
+            'date': state.last_date,
+            'moving_averages': dict(state.ma_values),
+            'high': state.max_queue[0][1] if state.max_queue else None,
+            'low': state.min_queue[0][1] if state.min_queue else None
+        }
@@ -5,7 +5,9 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .rolling import RollingPercentile
 
 
 class FXAnalyzer:
@@ -113,6 +115,310 @@ class FXAnalyzer:
         
         return df
     
+    def build_price_panel(
+        self,
+        data: Dict[str, pd.DataFrame],
+        price_column: str = 'Close'
+    ) -> pd.DataFrame:
+        """
+        여러 통화의 가격을 날짜 기준 패널로 정렬
+        
+        다른 통화만 거래한 날은 채우지 않고 NaN으로 둔다 (휴일을 0% 수익률로 만들지 않도록).
+        
+        Args:
+            data: {currency_code: 데이터프레임}
+            price_column: 가격 컬럼명
+            
+        Returns:
+            pandas.DataFrame: index=Date, columns=통화 코드 (해당 통화가 거래하지 않은 날은 NaN)
+        """
+        return pd.concat(
+            {code: df.set_index('Date')[price_column] for code, df in data.items()},
+            axis=1
+        ).sort_index()
+    
+    def calculate_risk_metrics(
+        self,
+        panel: pd.DataFrame,
+        volatility_window: int = 60,
+        var_window: int = 250,
+        var_confidence: float = 0.95,
+        periods_per_year: int = 250
+    ) -> Dict:
+        """
+        패널 전체 리스크 지표 계산 (통화별 반복 없이 벡터화)
+        
+        모든 구간과 기간은 패널 행이 아니라 각 통화 자신의 거래일 기준이다.
+        수익률은 같은 통화의 직전 거래일 대비이고, 거래하지 않은 날(NaN)은 건너뛴다.
+        
+        - 연율화 이동 변동성: 최근 volatility_window개 수익률의 분산 (누적합 차분)
+        - 낙폭: np.fmax.accumulate로 구한 누적 최고가 대비 하락률, 수면 아래 기간
+        - 역사적 VaR: 최근 var_window개 수익률의 (1 - var_confidence) 분위수
+        
+        Args:
+            panel: build_price_panel 결과
+            volatility_window: 변동성 구간 (거래일 수)
+            var_window: VaR 구간 (거래일 수)
+            var_confidence: VaR 신뢰수준
+            periods_per_year: 연율화 기준 거래일 수
+            
+        Returns:
+            dict: {'volatility': DataFrame(%), 'drawdown': DataFrame(%), 'summary': {code: 지표}}
+        """
+        prices = panel.to_numpy(dtype=float)
+        n_rows, n_cols = prices.shape
+        col_idx = np.arange(n_cols)
+        traded = ~np.isnan(prices)
+        
+        # 통화별 거래일 순번 (거래하지 않은 날은 직전 값 유지)
+        trade_idx = np.cumsum(traded, axis=0) - 1
+        
+        # 일간 수익률: 같은 통화의 직전 거래일 대비 (거래하지 않은 날 NaN)
+        last_price = pd.DataFrame(prices).ffill().to_numpy()
+        returns = np.full(prices.shape, np.nan)
+        with np.errstate(invalid='ignore'):
+            returns[1:] = np.where(traded[1:], prices[1:] / last_price[:-1] - 1, np.nan)
+        
+        # 누적합 (행 k 이전까지), 유효 수익률 개수로 구간 경계를 찾는다
+        valid = ~np.isnan(returns)
+        filled = np.where(valid, returns, 0.0)
+        zeros = np.zeros((1, n_cols))
+        cum_sum = np.vstack([zeros, np.cumsum(filled, axis=0)])
+        cum_sq = np.vstack([zeros, np.cumsum(filled * filled, axis=0)])
+        cum_count = np.vstack([zeros, np.cumsum(valid, axis=0)]).astype(np.int64)
+        
+        # 최근 volatility_window개 수익률 구간 시작 행: 열별 단조 증가 cum_count를 열마다 오프셋을 더해
+        # 하나의 정렬 배열로 만든 뒤 한 번의 searchsorted로 찾는다
+        stride = n_rows + 2
+        keys = (cum_count + col_idx * stride).T.ravel()
+        target = cum_count[1:] - volatility_window
+        start = np.searchsorted(keys, np.maximum(target, 0) + col_idx * stride) - col_idx * (n_rows + 1)
+        end = np.arange(1, n_rows + 1)[:, None]
+        
+        window_sum = cum_sum[end, col_idx] - cum_sum[start, col_idx]
+        window_sq = cum_sq[end, col_idx] - cum_sq[start, col_idx]
+        window_count = volatility_window
+        variance = (window_sq - window_sum * window_sum / window_count) / (window_count - 1)
+        variance = np.where((target >= 0) & traded, np.maximum(variance, 0.0), np.nan)
+        volatility = np.sqrt(variance * periods_per_year) * 100
+        
+        # 낙폭: 누적 최고가 대비 (거래하지 않은 날 NaN)
+        running_max = np.fmax.accumulate(prices, axis=0)
+        drawdown = (prices / running_max - 1) * 100
+        
+        # 수면 아래 기간: 마지막 고점 이후 경과 거래일
+        at_peak = traded & (prices >= running_max)
+        last_peak = np.maximum.accumulate(np.where(at_peak, trade_idx, -1), axis=0)
+        duration = np.where(traded & (last_peak >= 0), trade_idx - last_peak, 0)
+        
+        # 최대 낙폭 구간: 직전 고점부터 회복(고점 재도달)까지, 미회복이면 마지막 거래일까지
+        max_drawdown = np.nanmin(drawdown, axis=0)
+        max_drawdown_end = np.nanargmin(np.where(np.isnan(drawdown), np.inf, drawdown), axis=0)
+        next_peak = np.minimum.accumulate(np.where(at_peak, trade_idx, n_rows)[::-1], axis=0)[::-1]
+        last_trade = trade_idx[-1]
+        peak_before = last_peak[max_drawdown_end, col_idx]
+        recovered = next_peak[max_drawdown_end, col_idx]
+        max_drawdown_duration = np.minimum(recovered, last_trade) - peak_before
+        
+        # 역사적 VaR: 통화별 최근 var_window개 수익률 (손실률 %, 양수)
+        remaining = cum_count[-1] - cum_count[:-1]  # 해당 행 이후 유효 수익률 개수 (해당 행 포함)
+        recent_returns = np.where(valid & (remaining <= var_window), returns, np.nan)
+        with np.errstate(invalid='ignore'):
+            var = -np.nanpercentile(recent_returns, (1 - var_confidence) * 100, axis=0) * 100
+        
+        # 요약은 통화별 마지막 거래일 기준
+        last_row = n_rows - 1 - np.argmax(traded[::-1], axis=0)
+        
+        dates = panel.index
+        summary = {}
+        for col, code in enumerate(panel.columns):
+            row = last_row[col]
+            summary[code] = {
+                'volatility': float(volatility[row, col]),
+                'max_drawdown': float(max_drawdown[col]),
+                'max_drawdown_date': dates[max_drawdown_end[col]],
+                'max_drawdown_duration': int(max_drawdown_duration[col]),
+                'max_drawdown_recovered': bool(recovered[col] <= last_trade[col]),
+                'current_drawdown': float(drawdown[row, col]),
+                'current_drawdown_duration': int(duration[row, col]),
+                'var': float(var[col]),
+                'var_confidence': var_confidence
+            }
+        
+        return {
+            'volatility': pd.DataFrame(volatility, index=dates, columns=panel.columns),
+            'drawdown': pd.DataFrame(drawdown, index=dates, columns=panel.columns),
+            'summary': summary
+        }
+    
+    def calculate_rolling_percentile(
+        self,
+        df: pd.DataFrame,
+        windows: Dict[str, int],
+        price_column: str = 'Close',
+        min_periods: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        이동 구간 백분위 및 z-score 계산 (전체 이력 일괄 처리)
+        
+        Args:
+            df: 환율 데이터프레임
+            windows: 구간 딕셔너리 {'1Y': 250, '3Y': 750}
+            price_column: 가격 컬럼명
+            min_periods: 최소 데이터 수, None이면 구간 길이 (미달 구간은 NaN)
+            
+        Returns:
+            pandas.DataFrame: PCT{name}(0~1), ZSCORE{name} 컬럼이 추가된 데이터프레임
+        """
+        df = df.copy()
+        prices = df[price_column].to_numpy(dtype=float)
+        
+        for name, window in windows.items():
+            tracker = RollingPercentile(window, min_periods)
+            percentiles = np.empty(len(prices))
+            zscores = np.empty(len(prices))
+            for i, price in enumerate(prices):
+                percentiles[i], zscores[i] = tracker.update(price)
+            df[f'PCT{name}'] = percentiles
+            df[f'ZSCORE{name}'] = zscores
+        
+        return df
+    
+    def create_percentile_trackers(
+        self,
+        df: pd.DataFrame,
+        windows: Dict[str, int],
+        price_column: str = 'Close',
+        min_periods: Optional[int] = None
+    ) -> Dict[str, RollingPercentile]:
+        """
+        증분 계산용 백분위 추적기 생성 (최근 구간으로 초기화)
+        
+        반환된 추적기의 update(price)를 새 데이터마다 호출하면
+        (백분위, z-score)를 O(log n)으로 얻는다.
+        
+        Args:
+            df: 환율 데이터프레임
+            windows: 구간 딕셔너리 {'1Y': 250, '3Y': 750}
+            price_column: 가격 컬럼명
+            min_periods: 최소 데이터 수, None이면 구간 길이
+            
+        Returns:
+            dict: {name: RollingPercentile}
+        """
+        trackers = {}
+        for name, window in windows.items():
+            tracker = RollingPercentile(window, min_periods)
+            for price in df[price_column].tail(window).to_numpy(dtype=float):
+                tracker.update(price)
+            trackers[name] = tracker
+        return trackers
+    
+    def build_pyramid(
+        self,
+        df: pd.DataFrame,
+        levels: Dict[str, Optional[str]],
+        value_columns: List[str],
+        price_column: str = 'Close'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        다해상도 데이터 피라미드 생성
+        
+        가격은 기간별 OHLC(대표값은 종가), 나머지 컬럼은 기간 평균으로 집계한다.
+        각 집계 구간의 Date는 구간 내 마지막 실제 거래일이다.
+        
+        Args:
+            df: 분석된 환율 데이터프레임
+            levels: {레벨명: resample 주기} (None이면 원본 해상도), 세밀한 순서
+            value_columns: 평균으로 집계할 컬럼명 (예: 이동평균)
+            price_column: 가격 컬럼명
+            
+        Returns:
+            dict: {레벨명: 집계된 데이터프레임}
+        """
+        value_columns = [col for col in value_columns if col in df.columns]
+        pyramid = {}
+        
+        for level_name, rule in levels.items():
+            if rule is None:
+                level_df = df[['Date', price_column] + value_columns].copy()
+                level_df['Open'] = level_df[price_column]
+                level_df['High'] = level_df[price_column]
+                level_df['Low'] = level_df[price_column]
+                level_df = level_df[['Date', 'Open', 'High', 'Low', price_column] + value_columns]
+            else:
+                aggregations = {
+                    'Date': ('Date', 'last'),
+                    'Open': (price_column, 'first'),
+                    'High': (price_column, 'max'),
+                    'Low': (price_column, 'min'),
+                    price_column: (price_column, 'last')
+                }
+                for col in value_columns:
+                    aggregations[col] = (col, 'mean')
+                
+                level_df = df.groupby(pd.Grouper(key='Date', freq=rule)).agg(**aggregations)
+                level_df = level_df.dropna(subset=['Date']).reset_index(drop=True)
+            
+            pyramid[level_name] = level_df
+        
+        return pyramid
+    
+    def analyze_trend_chunked(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        ma_periods: Dict[str, int],
+        price_column: str = 'Close'
+    ) -> Iterator[pd.DataFrame]:
+        """
+        전체 분석 수행 (청크 스트리밍, 메모리보다 큰 이력용)
+        
+        청크 사이에는 가장 긴 이동평균 기간만큼의 원본 가격 꼬리, 직전 가격, 첫 가격만 넘기므로
+        최대 메모리는 청크 크기 + 최대 이동평균 기간에 비례하고 전체 길이와 무관하다.
+        각 청크는 꼬리 + 청크에 calculate_moving_averages(analyze_trend와 같은 rolling 평균)를
+        적용한 뒤 꼬리 행을 버리므로, 결과는 전체 데이터에 analyze_trend를 적용한 것과
+        부동소수점 반올림 수준에서 같고 오차가 이력 길이에 따라 커지지 않는다.
+        
+        Args:
+            chunks: Date 기준 정렬된 데이터프레임 청크 (예: FXTimeSeriesStore.iter_frames)
+            ma_periods: 이동평균 기간
+            price_column: 가격 컬럼명
+            
+        Yields:
+            pandas.DataFrame: 이동평균, daily_change, cumulative_change가 추가된 청크
+        """
+        max_period = max(ma_periods.values(), default=1)
+        
+        tail = np.empty(0)  # 직전 청크까지의 마지막 max_period개 가격
+        first_price = None
+        
+        for chunk in chunks:
+            n = len(chunk)
+            if n == 0:
+                continue
+            
+            values = chunk[price_column].to_numpy(dtype=np.float64)
+            if first_price is None:
+                first_price = values[0]
+            
+            # 꼬리 + 청크로 이동평균 계산 후 꼬리 행 제외
+            prices = np.concatenate((tail, values))
+            analyzed = self.calculate_moving_averages(pd.DataFrame({price_column: prices}), ma_periods, price_column)
+            result = {ma_name: analyzed[ma_name].to_numpy()[len(tail):] for ma_name in ma_periods}
+            
+            # 일별 변동률 (%)
+            daily_change = np.empty(n)
+            daily_change[0] = np.nan if len(tail) == 0 else (values[0] / tail[-1] - 1) * 100
+            daily_change[1:] = (values[1:] / values[:-1] - 1) * 100
+            result['daily_change'] = daily_change
+            
+            # 누적 변동률 (첫 날 대비 %)
+            result['cumulative_change'] = (values - first_price) / first_price * 100
+            
+            tail = prices[-max_period:].copy()
+            
+            yield chunk.assign(**result)
+    
     def analyze_trend(
         self,
         df: pd.DataFrame,
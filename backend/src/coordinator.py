@@ -0,0 +1,253 @@
+"""
+작업 분배 모듈
+SQLite lease 테이블로 여러 워커 프로세스(공유 파일시스템의 여러 호스트 포함)에 통화쌍 분배
+"""
+
+import os
+import socket
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    run_id TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    expires_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    PRIMARY KEY (run_id, currency)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class FXShardCoordinator:
+    """
+    lease 기반 통화쌍 분배 클래스
+
+    각 워커는 claim()으로 통화쌍 하나의 lease를 얻고, 처리 중 renew()로 연장한 뒤
+    complete()로 완료 처리한다. 워커가 죽어 lease가 만료되면 다른 워커가 다시 가져간다.
+    상태 변경은 BEGIN IMMEDIATE 트랜잭션으로 직렬화된다.
+
+    상태: pending → leased → done / failed (max_attempts 초과)
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        run_id: str,
+        owner: Optional[str] = None,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3
+    ):
+        """
+        초기화
+
+        Args:
+            db_path: lease 데이터베이스 경로 (워커 간 공유)
+            run_id: 실행 식별자 (같은 run_id의 워커끼리 작업 공유)
+            owner: 워커 식별자, None이면 '호스트명:PID'
+            lease_seconds: lease 유효 시간 (초)
+            max_attempts: 통화쌍별 최대 시도 횟수
+        """
+        self.db_path = db_path
+        self.run_id = run_id
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, timeout=30.0, isolation_level=None)
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def new_run_id() -> str:
+        """새 실행 식별자 생성 (시각 + PID)"""
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+    @staticmethod
+    def latest_run_id(db_path: str) -> Optional[str]:
+        """
+        가장 최근에 등록된 실행 식별자 조회
+
+        Args:
+            db_path: lease 데이터베이스 경로
+
+        Returns:
+            str: 실행 식별자, 등록된 실행이 없으면 None
+        """
+        if not os.path.exists(db_path):
+            return None
+        conn = sqlite3.connect(db_path, timeout=30.0)
+        try:
+            conn.executescript(_SCHEMA)
+            row = conn.execute('SELECT run_id FROM runs ORDER BY created_at DESC LIMIT 1').fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def close(self):
+        """연결 닫기"""
+        self._conn.close()
+
+    def _transaction(self, fn):
+        """쓰기 잠금 트랜잭션 안에서 fn(cursor) 실행"""
+        cursor = self._conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            result = fn(cursor)
+            cursor.execute('COMMIT')
+            return result
+        except BaseException:
+            cursor.execute('ROLLBACK')
+            raise
+
+    def register(self, currency_codes: List[str]):
+        """
+        실행 대상 통화쌍 등록 (이미 등록된 항목은 유지)
+
+        같은 run_id의 워커가 나중에 합류해도 완료된 항목을 다시 처리하지 않는다.
+        새로 처리하려면 새 run_id(new_run_id)를 사용한다.
+
+        Args:
+            currency_codes: 통화 코드 목록
+        """
+        def _register(cur):
+            cur.execute(
+                'INSERT OR IGNORE INTO runs (run_id, created_at) VALUES (?, ?)',
+                (self.run_id, time.time())
+            )
+            cur.executemany(
+                'INSERT OR IGNORE INTO leases (run_id, currency) VALUES (?, ?)',
+                [(self.run_id, code) for code in currency_codes]
+            )
+
+        self._transaction(_register)
+
+    def claim(self) -> Optional[str]:
+        """
+        처리할 통화쌍 하나의 lease 획득
+
+        Returns:
+            str: 통화 코드, 남은 작업이 없으면 None
+        """
+        def _claim(cur):
+            now = time.time()
+            # 시도 횟수를 모두 쓴 채 만료된 lease는 실패 처리
+            cur.execute(
+                """
+                UPDATE leases SET status = 'failed', owner = NULL, expires_at = NULL,
+                    error = COALESCE(error, 'lease expired')
+                WHERE run_id = ? AND status = 'leased' AND expires_at < ? AND attempts >= ?
+                """,
+                (self.run_id, now, self.max_attempts)
+            )
+            row = cur.execute(
+                """
+                SELECT currency FROM leases
+                WHERE run_id = ? AND attempts < ?
+                  AND (status = 'pending' OR (status = 'leased' AND expires_at < ?))
+                ORDER BY currency LIMIT 1
+                """,
+                (self.run_id, self.max_attempts, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            cur.execute(
+                """
+                UPDATE leases SET status = 'leased', owner = ?, expires_at = ?, attempts = attempts + 1
+                WHERE run_id = ? AND currency = ?
+                """,
+                (self.owner, now + self.lease_seconds, self.run_id, row[0])
+            )
+            return row[0]
+
+        return self._transaction(_claim)
+
+    def renew(self, currency_code: str) -> bool:
+        """
+        lease 연장
+
+        Args:
+            currency_code: 통화 코드
+
+        Returns:
+            bool: 연장 성공 여부 (lease를 잃었으면 False)
+        """
+        def _renew(cur):
+            cur.execute(
+                """
+                UPDATE leases SET expires_at = ?
+                WHERE run_id = ? AND currency = ? AND owner = ? AND status = 'leased'
+                """,
+                (time.time() + self.lease_seconds, self.run_id, currency_code, self.owner)
+            )
+            return cur.rowcount == 1
+
+        return self._transaction(_renew)
+
+    def complete(self, currency_code: str) -> bool:
+        """
+        완료 처리
+
+        Args:
+            currency_code: 통화 코드
+
+        Returns:
+            bool: 성공 여부 (lease를 잃었으면 False)
+        """
+        def _complete(cur):
+            cur.execute(
+                """
+                UPDATE leases SET status = 'done', expires_at = NULL, error = NULL
+                WHERE run_id = ? AND currency = ? AND owner = ? AND status = 'leased'
+                """,
+                (self.run_id, currency_code, self.owner)
+            )
+            return cur.rowcount == 1
+
+        return self._transaction(_complete)
+
+    def fail(self, currency_code: str, error: str):
+        """
+        실패 처리 (시도 횟수가 남았으면 다시 pending)
+
+        Args:
+            currency_code: 통화 코드
+            error: 오류 메시지
+        """
+        self._transaction(lambda cur: cur.execute(
+            """
+            UPDATE leases
+            SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                owner = NULL, expires_at = NULL, error = ?
+            WHERE run_id = ? AND currency = ? AND owner = ?
+            """,
+            (self.max_attempts, error, self.run_id, currency_code, self.owner)
+        ))
+
+    def status(self) -> Dict[str, Dict]:
+        """
+        실행 상태 조회
+
+        Returns:
+            dict: {currency: {'status', 'owner', 'attempts', 'error'}}
+        """
+        rows = self._conn.execute(
+            'SELECT currency, status, owner, attempts, error FROM leases WHERE run_id = ?',
+            (self.run_id,)
+        ).fetchall()
+        return {
+            currency: {'status': status, 'owner': owner, 'attempts': attempts, 'error': error}
+            for currency, status, owner, attempts, error in rows
+        }
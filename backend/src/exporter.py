@@ -0,0 +1,305 @@
+"""
+내보내기 모듈
+분석 결과를 Arrow IPC / Parquet 파일로 저장 (통화쌍별 파티션)
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+
+SCHEMA_VERSION = '1'
+SUPPORTED_FORMATS = ('arrow', 'parquet')
+
+# 시계열 데이터셋 (담긴 구간이 다르므로 디렉토리를 분리)
+SERIES_DATASET = 'series'  # export_series: 대시보드 표시 기간
+FULL_SERIES_DATASET = 'series_full'  # open_series_writer: 저장소 전체 이력 (청크 분석)
+
+# 통계 테이블 스키마 (리스크 지표는 없으면 null)
+STATISTICS_SCHEMA = pa.schema([
+    ('currency', pa.string()),
+    ('max_price', pa.float64()),
+    ('max_date', pa.timestamp('ms')),
+    ('min_price', pa.float64()),
+    ('min_date', pa.timestamp('ms')),
+    ('current_price', pa.float64()),
+    ('current_date', pa.timestamp('ms')),
+    ('volatility', pa.float64()),
+    ('max_drawdown', pa.float64()),
+    ('max_drawdown_duration', pa.int64()),
+    ('max_drawdown_recovered', pa.bool_()),
+    ('current_drawdown', pa.float64()),
+    ('var', pa.float64()),
+    ('var_confidence', pa.float64())
+], metadata={'schema_version': SCHEMA_VERSION})
+
+
+def _frame_to_table(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    """데이터프레임을 고정 스키마 테이블로 변환 (없는 컬럼은 null)"""
+    arrays = []
+    for field in schema:
+        if field.name in df.columns:
+            arrays.append(pa.array(df[field.name].to_numpy(), type=field.type, from_pandas=True))
+        else:
+            arrays.append(pa.nulls(len(df), type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class SeriesWriter:
+    """
+    시계열 청크 단위 기록기 (FXExporter.open_series_writer로 생성)
+
+    청크마다 Arrow IPC 레코드 배치 / Parquet row group으로 바로 기록하므로
+    전체 시계열을 메모리에 모으지 않는다. 임시 파일에 기록한 뒤 close() 시 원자적으로 교체한다.
+    """
+
+    def __init__(self, paths: Dict[str, Path], schema: pa.Schema):
+        """
+        초기화
+
+        Args:
+            paths: {형식: 최종 파일 경로}
+            schema: 테이블 스키마
+        """
+        self.schema = schema
+        self.rows = 0
+        self._targets = []
+        try:
+            for fmt, path in paths.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f'.{path.name}.tmp')
+                if fmt == 'arrow':
+                    writer = pa.ipc.new_file(str(tmp_path), schema)
+                else:
+                    writer = pq.ParquetWriter(str(tmp_path), schema)
+                self._targets.append((writer, tmp_path, path))
+        except BaseException:
+            self.abort()
+            raise
+
+    def write(self, df: pd.DataFrame):
+        """
+        청크 기록
+
+        Args:
+            df: 분석된 청크 데이터프레임
+        """
+        table = _frame_to_table(df, self.schema)
+        for writer, _, _ in self._targets:
+            writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        """기록 완료 후 최종 경로로 교체"""
+        for writer, _, _ in self._targets:
+            writer.close()
+        for _, tmp_path, path in self._targets:
+            os.replace(tmp_path, path)
+        self._targets = []
+
+    def abort(self):
+        """기록 중단 (임시 파일 삭제, 기존 파일 유지)"""
+        for writer, tmp_path, _ in self._targets:
+            writer.close()
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self._targets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class FXExporter:
+    """
+    분석 결과 내보내기 클래스
+
+    출력 구조 (형식별 디렉토리):
+        {output_dir}/arrow/series/currency=USD_KRW/data.arrow        (표시 기간)
+        {output_dir}/arrow/series_full/currency=USD_KRW/data.arrow   (전체 이력, 청크 분석)
+        {output_dir}/arrow/statistics.arrow
+        {output_dir}/parquet/series/currency=USD_KRW/data.parquet
+        {output_dir}/parquet/series_full/currency=USD_KRW/data.parquet
+        {output_dir}/parquet/statistics.parquet
+
+    Arrow IPC 파일은 압축 없이 기록하므로 pyarrow.memory_map으로 복사 없이 열 수 있고,
+    Parquet은 컬럼 단위로 필요한 컬럼만 읽을 수 있다.
+    currency=... 디렉토리는 pyarrow.dataset의 hive 파티션으로 인식된다.
+    """
+
+    def __init__(self, output_dir: str, formats: Tuple[str, ...] = SUPPORTED_FORMATS):
+        """
+        초기화
+
+        Args:
+            output_dir: 출력 디렉토리
+            formats: 출력 형식 ('arrow', 'parquet')
+        """
+        unknown = set(formats) - set(SUPPORTED_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported export formats: {sorted(unknown)}")
+
+        self.output_dir = Path(output_dir)
+        self.formats = tuple(formats)
+
+    def build_series_schema(
+        self,
+        ma_names: List[str],
+        price_column: str = 'Close',
+        dataset: str = SERIES_DATASET
+    ) -> pa.Schema:
+        """
+        시계열 테이블 스키마 (Date, 가격, 이동평균, 변동률 순)
+
+        Args:
+            ma_names: 이동평균 컬럼명
+            price_column: 가격 컬럼명
+            dataset: 담긴 구간 (SERIES_DATASET / FULL_SERIES_DATASET), 스키마 메타데이터에 기록
+
+        Returns:
+            pyarrow.Schema: 고정 스키마
+        """
+        fields = [('Date', pa.timestamp('ms')), (price_column, pa.float64())]
+        fields += [(name, pa.float64()) for name in ma_names]
+        fields += [('daily_change', pa.float64()), ('cumulative_change', pa.float64())]
+        return pa.schema(fields, metadata={'schema_version': SCHEMA_VERSION, 'dataset': dataset})
+
+    def _write_table(self, table: pa.Table, relative_stem: str):
+        """
+        테이블을 형식별로 기록 (임시 파일 기록 후 원자적 교체)
+
+        Args:
+            table: 기록할 테이블
+            relative_stem: 형식 디렉토리 기준, 확장자를 제외한 상대 경로
+        """
+        for fmt in self.formats:
+            path = self.output_dir / fmt / f'{relative_stem}.{fmt}'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f'.{path.name}.tmp')
+            try:
+                if fmt == 'arrow':
+                    feather.write_feather(table, str(tmp_path), compression='uncompressed')
+                else:
+                    pq.write_table(table, str(tmp_path))
+                os.replace(tmp_path, path)
+            except BaseException:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
+
+    def export_series(
+        self,
+        currency_code: str,
+        df: pd.DataFrame,
+        ma_names: List[str],
+        price_column: str = 'Close'
+    ):
+        """
+        통화쌍 분석 시계열 내보내기
+
+        Args:
+            currency_code: 통화 코드
+            df: 분석된 환율 데이터프레임
+            ma_names: 이동평균 컬럼명
+            price_column: 가격 컬럼명
+        """
+        schema = self.build_series_schema(ma_names, price_column, SERIES_DATASET)
+        table = _frame_to_table(df, schema)
+        self._write_table(table, f'{SERIES_DATASET}/{self._partition(currency_code)}/data')
+
+    def open_series_writer(
+        self,
+        currency_code: str,
+        ma_names: List[str],
+        price_column: str = 'Close'
+    ) -> SeriesWriter:
+        """
+        통화쌍 분석 시계열을 청크 단위로 기록하는 기록기 생성
+
+        export_series(표시 기간)와 구분되도록 FULL_SERIES_DATASET 디렉토리에 같은 스키마로 기록한다.
+
+        Args:
+            currency_code: 통화 코드
+            ma_names: 이동평균 컬럼명
+            price_column: 가격 컬럼명
+
+        Returns:
+            SeriesWriter: with 문으로 사용 (정상 종료 시 교체, 예외 시 폐기)
+        """
+        schema = self.build_series_schema(ma_names, price_column, FULL_SERIES_DATASET)
+        stem = f'{FULL_SERIES_DATASET}/{self._partition(currency_code)}/data'
+        paths = {fmt: self.output_dir / fmt / f'{stem}.{fmt}' for fmt in self.formats}
+        return SeriesWriter(paths, schema)
+
+    @staticmethod
+    def _partition(currency_code: str) -> str:
+        """hive 파티션 디렉토리명"""
+        return f"currency={currency_code.replace('/', '_')}"
+
+    def build_statistics_schema(self, percentile_names: List[str]) -> pa.Schema:
+        """
+        통계 테이블 스키마 (STATISTICS_SCHEMA + 구간별 백분위 / z-score)
+
+        Args:
+            percentile_names: 백분위 구간명 (예: ['1Y', '3Y'])
+
+        Returns:
+            pyarrow.Schema: 통계 스키마
+        """
+        fields = list(STATISTICS_SCHEMA)
+        for name in percentile_names:
+            fields += [pa.field(f'percentile_{name}', pa.float64()), pa.field(f'zscore_{name}', pa.float64())]
+        return pa.schema(fields, metadata=STATISTICS_SCHEMA.metadata)
+
+    def export_statistics(self, statistics: Dict[str, Dict]):
+        """
+        통화별 통계 내보내기
+
+        Args:
+            statistics: {currency_code: FXAnalyzer.get_statistics 결과 (+ 'risk', 'percentile')}
+        """
+        percentile_names = []
+        for stats in statistics.values():
+            for name in stats.get('percentile') or {}:
+                if name not in percentile_names:
+                    percentile_names.append(name)
+
+        rows = []
+        for currency_code, stats in statistics.items():
+            risk = stats.get('risk') or {}
+            percentile = stats.get('percentile') or {}
+            row = {
+                'currency': currency_code,
+                'max_price': float(stats['max']['price']),
+                'max_date': stats['max']['date'],
+                'min_price': float(stats['min']['price']),
+                'min_date': stats['min']['date'],
+                'current_price': float(stats['current']['price']),
+                'current_date': stats['current']['date'],
+                'volatility': risk.get('volatility'),
+                'max_drawdown': risk.get('max_drawdown'),
+                'max_drawdown_duration': risk.get('max_drawdown_duration'),
+                'max_drawdown_recovered': risk.get('max_drawdown_recovered'),
+                'current_drawdown': risk.get('current_drawdown'),
+                'var': risk.get('var'),
+                'var_confidence': risk.get('var_confidence')
+            }
+            for name in percentile_names:
+                values = percentile.get(name) or {}
+                for column, key in ((f'percentile_{name}', 'rank'), (f'zscore_{name}', 'zscore')):
+                    value = values.get(key)
+                    row[column] = None if value is None or pd.isna(value) else float(value)
+            rows.append(row)
+
+        table = pa.Table.from_pylist(rows, schema=self.build_statistics_schema(percentile_names))
+        self._write_table(table, 'statistics')
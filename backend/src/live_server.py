@@ -0,0 +1,216 @@
+"""
+실시간 갱신 서버 모듈
+WebSocket으로 신규 데이터 / 이동평균 / 변경된 통계만 브라우저에 전송
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+import pandas as pd
+import websockets
+
+
+# 통계 카드에 표시되는 항목
+STAT_KEYS = ('max', 'min', 'current')
+
+
+def _format_stat(stat: Dict) -> Dict:
+    """통계 항목을 JSON 전송 형식으로 변환"""
+    return {
+        'price': float(stat['price']),
+        'formatted_date': stat['formatted_date']
+    }
+
+
+class _Client:
+    """클라이언트별 전송 대기열 (통화별로 병합 후 최소 간격마다 전송)"""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.pending = {}
+        self.last_sent = 0.0
+        self.flush_handle = None
+
+    def merge(self, frame: Dict):
+        """대기 중인 같은 통화 프레임과 병합"""
+        currency = frame['currency']
+        pending = self.pending.get(currency)
+        if pending is None:
+            self.pending[currency] = {
+                'type': 'delta',
+                'currency': currency,
+                'columns': list(frame['columns']),
+                'x': list(frame['x']),
+                'y': {col: list(values) for col, values in frame['y'].items()},
+                'stats': dict(frame['stats'])
+            }
+            return
+
+        pending['x'].extend(frame['x'])
+        for col, values in frame['y'].items():
+            pending['y'].setdefault(col, []).extend(values)
+        pending['stats'].update(frame['stats'])
+
+
+class FXLiveServer:
+    """
+    WebSocket 실시간 갱신 서버
+
+    publish()로 전달된 delta 프레임(신규 봉, 이동평균 값, 변경된 통계)을 연결된 브라우저에 보낸다.
+    클라이언트마다 min_interval 초에 한 번만 전송하며, 그 사이 들어온 프레임은 통화별로 병합된다.
+    브라우저는 Plotly.extendTraces로 트레이스를 늘리고 요약 카드를 제자리에서 갱신한다.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 8765,
+        min_interval: float = 1.0
+    ):
+        """
+        초기화
+
+        Args:
+            host: 바인딩 주소
+            port: 포트
+            min_interval: 클라이언트별 최소 전송 간격 (초)
+        """
+        self.host = host
+        self.port = port
+        self.min_interval = min_interval
+        self.clients = {}
+        self.snapshot = {}  # 통화별 최신 통계 (변경분 계산용)
+        self.backlog = _Client(None)  # 페이지 생성 이후 누적 프레임 (신규 접속 클라이언트용)
+        self._server = None
+        self._loop = None
+        self._tasks = set()
+
+    @property
+    def url(self) -> str:
+        """브라우저 접속 URL"""
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        """서버 시작"""
+        self._loop = asyncio.get_running_loop()
+        self._server = await websockets.serve(self._handler, self.host, self.port)
+
+    async def stop(self):
+        """서버 종료"""
+        for client in list(self.clients.values()):
+            if client.flush_handle is not None:
+                client.flush_handle.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handler(self, websocket, path=None):
+        """클라이언트 연결 처리"""
+        # 등록과 누적 프레임 직렬화를 await 없이 처리해 중복/누락 방지
+        client = _Client(websocket)
+        self.clients[websocket] = client
+        messages = [
+            json.dumps(frame, ensure_ascii=False, separators=(',', ':'))
+            for frame in self.backlog.pending.values()
+        ]
+        try:
+            for message in messages:
+                await websocket.send(message)
+            await websocket.wait_closed()
+        finally:
+            if client.flush_handle is not None:
+                client.flush_handle.cancel()
+            self.clients.pop(websocket, None)
+
+    def set_snapshot(self, currency_code: str, statistics: Dict):
+        """
+        통화별 기준 통계 등록 (페이지 생성 시점 값, 이후 변경분만 전송)
+
+        Args:
+            currency_code: 통화 코드
+            statistics: FXAnalyzer.get_statistics 결과
+        """
+        self.snapshot[currency_code] = {key: _format_stat(statistics[key]) for key in STAT_KEYS}
+
+    def make_delta_frame(
+        self,
+        currency_code: str,
+        new_rows: pd.DataFrame,
+        ma_names: List[str],
+        statistics: Dict,
+        price_column: str = 'Close'
+    ) -> Dict:
+        """
+        delta 프레임 생성 (변경된 통계만 포함)
+
+        Args:
+            currency_code: 통화 코드
+            new_rows: 새로 추가된 분석 데이터 (Date, 가격, 이동평균)
+            ma_names: 이동평균 컬럼명
+            statistics: FXAnalyzer.get_statistics 결과
+            price_column: 가격 컬럼명
+
+        Returns:
+            dict: {'type': 'delta', 'currency', 'columns', 'x', 'y', 'stats'}
+        """
+        columns = [price_column] + [name for name in ma_names if name in new_rows.columns]
+        previous = self.snapshot.get(currency_code, {})
+
+        stats = {}
+        for key in STAT_KEYS:
+            value = _format_stat(statistics[key])
+            if previous.get(key) != value:
+                stats[key] = value
+
+        return {
+            'type': 'delta',
+            'currency': currency_code,
+            'columns': columns,
+            'x': new_rows['Date'].dt.strftime('%Y-%m-%d').tolist(),
+            'y': {col: [None if pd.isna(v) else round(float(v), 4) for v in new_rows[col]] for col in columns},
+            'stats': stats
+        }
+
+    def publish(self, frame: Dict):
+        """
+        delta 프레임 전송 예약 (이벤트 루프 스레드에서 호출)
+
+        Args:
+            frame: make_delta_frame 결과
+        """
+        snapshot = self.snapshot.setdefault(frame['currency'], {})
+        snapshot.update(frame['stats'])
+
+        if not frame['x'] and not frame['stats']:
+            return
+
+        self.backlog.merge(frame)
+
+        now = time.monotonic()
+        for client in self.clients.values():
+            client.merge(frame)
+            if client.flush_handle is None:
+                delay = max(0.0, client.last_sent + self.min_interval - now)
+                client.flush_handle = self._loop.call_later(delay, self._schedule_flush, client)
+
+    def _schedule_flush(self, client: _Client):
+        """전송 태스크 생성"""
+        task = self._loop.create_task(self._flush(client))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, client: _Client):
+        """클라이언트 대기열 전송"""
+        frames = list(client.pending.values())
+        client.pending = {}
+        client.flush_handle = None
+        client.last_sent = time.monotonic()
+
+        try:
+            for frame in frames:
+                await client.websocket.send(json.dumps(frame, ensure_ascii=False, separators=(',', ':')))
+        except websockets.ConnectionClosed:
+            self.clients.pop(client.websocket, None)
@@ -0,0 +1,129 @@
+"""
+파이프라인 모듈
+수집/분석/렌더링 단계를 bounded queue로 연결해 겹쳐서 실행
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# 단계 종료 신호
+_DONE = object()
+
+
+class FXPipeline:
+    """
+    단계별 생산자/소비자 파이프라인
+
+    각 단계는 (이름, 함수, 워커 수)로 정의되며, 단계 사이는 크기가 제한된 큐로 연결된다.
+    큐가 가득 차면 앞 단계가 대기하므로(backpressure) 메모리 사용량이 제한되고,
+    통화쌍 N+1 수집과 N 분석, N-1 렌더링이 동시에 진행된다.
+    단계 함수는 fn(key, value)를 받아 다음 단계로 넘길 값을 반환하며,
+    None을 반환하거나 예외가 발생한 항목은 이후 단계에서 제외된다.
+    """
+
+    def __init__(
+        self,
+        stages: List[Tuple[str, Callable[[Any, Any], Any], int]],
+        queue_size: int = 4,
+        on_error: Optional[Callable[[str, Any, Exception], None]] = None
+    ):
+        """
+        초기화
+
+        Args:
+            stages: [(단계명, 단계 함수, 워커 수)] 실행 순서대로
+            queue_size: 단계 사이 큐의 최대 크기
+            on_error: 항목 처리 실패 시 호출할 콜백 (단계명, key, 예외)
+        """
+        if not stages:
+            raise ValueError("At least one stage is required")
+
+        self.stages = [(name, fn, max(1, int(workers))) for name, fn, workers in stages]
+        self.queue_size = max(1, int(queue_size))
+        self.on_error = on_error
+
+    def run(self, items: Iterable[Tuple[Any, Any]]) -> Dict[Any, Any]:
+        """
+        파이프라인 실행
+
+        Args:
+            items: (key, value) 입력 항목 (첫 단계에 순서대로 투입)
+
+        Returns:
+            dict: {key: 마지막 단계 결과} (입력 순서 유지, 실패 항목 제외)
+        """
+        items = list(items)
+        results = dict(self.iter_results(items))
+        return {key: results[key] for key, _ in items if key in results}
+
+    def iter_results(self, items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[Any, Any]]:
+        """
+        파이프라인 실행 (마지막 단계 결과를 완료되는 즉시 순회)
+
+        결과 큐도 queue_size로 제한되므로, 소비하는 쪽이 결과를 기록하고 버리면
+        동시에 메모리에 있는 항목 수가 통화쌍 수와 무관하게 유지된다.
+
+        Args:
+            items: (key, value) 입력 항목 (첫 단계에 순서대로 투입)
+
+        Yields:
+            tuple: (key, 마지막 단계 결과) (완료 순서, 실패 항목 제외)
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        lock = threading.Lock()
+        remaining = [workers for _, _, workers in self.stages]
+
+        def worker(stage_idx: int):
+            name, fn, _ = self.stages[stage_idx]
+            in_queue = queues[stage_idx]
+
+            while True:
+                item = in_queue.get()
+                if item is _DONE:
+                    break
+
+                key, value = item
+                try:
+                    output = fn(key, value)
+                except Exception as e:
+                    if self.on_error is not None:
+                        self.on_error(name, key, e)
+                    continue
+
+                if output is not None:
+                    queues[stage_idx + 1].put((key, output))
+
+            # 단계의 마지막 워커가 다음 단계(마지막 단계면 결과 큐)에 종료 신호 전달
+            with lock:
+                remaining[stage_idx] -= 1
+                stage_finished = remaining[stage_idx] == 0
+            if stage_finished:
+                next_workers = self.stages[stage_idx + 1][2] if stage_idx + 1 < len(self.stages) else 1
+                for _ in range(next_workers):
+                    queues[stage_idx + 1].put(_DONE)
+
+        def feed():
+            # 입력 투입 (큐가 가득 차면 대기)
+            for key, value in items:
+                queues[0].put((key, value))
+            for _ in range(self.stages[0][2]):
+                queues[0].put(_DONE)
+
+        threads = [threading.Thread(target=feed, name="feed", daemon=True)]
+        for stage_idx, (name, _, workers) in enumerate(self.stages):
+            for i in range(workers):
+                threads.append(threading.Thread(target=worker, args=(stage_idx,), name=f"{name}-{i}", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        out_queue = queues[-1]
+        while True:
+            item = out_queue.get()
+            if item is _DONE:
+                break
+            yield item
+
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,192 @@
+"""
+롤링 순서통계 모듈
+인덱스 가능 스킵리스트 기반 이동 구간 백분위 / z-score 계산
+"""
+
+import math
+import random
+from collections import deque
+from typing import Optional, Tuple
+
+
+class _Node:
+    """스킵리스트 노드"""
+
+    __slots__ = ('value', 'next', 'width')
+
+    def __init__(self, value, next_nodes, widths):
+        self.value = value
+        self.next = next_nodes
+        self.width = widths
+
+
+# 리스트 끝 표시 노드
+_NIL = _Node(math.inf, [], [])
+
+
+class IndexableSkiplist:
+    """
+    인덱스 가능 스킵리스트 (정렬 유지, 중복 허용)
+
+    각 링크에 건너뛰는 원소 수(width)를 저장하므로 삽입, 삭제, 순위 조회가 모두 O(log n)이다.
+    """
+
+    def __init__(self, expected_size: int = 100):
+        """
+        초기화
+
+        Args:
+            expected_size: 예상 최대 원소 수 (레벨 수 결정)
+        """
+        self.size = 0
+        self.maxlevels = int(1 + math.log2(max(expected_size, 2)))
+        self.head = _Node(None, [_NIL] * self.maxlevels, [1] * self.maxlevels)
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, value: float):
+        """값 삽입"""
+        chain = [None] * self.maxlevels
+        steps_at_level = [0] * self.maxlevels
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        depth = min(self.maxlevels, 1 - int(math.log2(1.0 - random.random())))
+        new_node = _Node(value, [None] * depth, [None] * depth)
+        steps = 0
+        for level in range(depth):
+            prev_node = chain[level]
+            new_node.next[level] = prev_node.next[level]
+            prev_node.next[level] = new_node
+            new_node.width[level] = prev_node.width[level] - steps
+            prev_node.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(depth, self.maxlevels):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, value: float):
+        """값 하나 삭제"""
+        chain = [None] * self.maxlevels
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is _NIL or target.value != value:
+            raise KeyError(f"Value not found: {value}")
+
+        depth = len(target.next)
+        for level in range(depth):
+            prev_node = chain[level]
+            prev_node.width[level] += target.width[level] - 1
+            prev_node.next[level] = target.next[level]
+        for level in range(depth, self.maxlevels):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def count_less(self, value: float, inclusive: bool = False) -> int:
+        """
+        value보다 작은 (inclusive=True면 작거나 같은) 원소 수
+
+        Args:
+            value: 기준값
+            inclusive: 같은 값 포함 여부
+
+        Returns:
+            int: 원소 수
+        """
+        count = 0
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            if inclusive:
+                while node.next[level].value <= value:
+                    count += node.width[level]
+                    node = node.next[level]
+            else:
+                while node.next[level].value < value:
+                    count += node.width[level]
+                    node = node.next[level]
+        return count
+
+
+class RollingPercentile:
+    """
+    이동 구간 백분위 / z-score 증분 계산
+
+    백분위는 pandas rolling().rank(pct=True, method='average')와 같은 정의이고,
+    z-score는 (가격 - 구간 평균) / 구간 표준편차(ddof=1)이다.
+    pandas와 마찬가지로 구간 데이터가 min_periods개 미만이면 NaN을 반환한다.
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            window: 구간 길이 (거래일 수)
+            min_periods: 값을 계산할 최소 데이터 수, None이면 window (pandas 기본값과 동일)
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else max(1, min(int(min_periods), window))
+        self.values = deque()
+        self.skiplist = IndexableSkiplist(window)
+
+        # 누적합 (기준값 shift로 소거 오차 완화)
+        self._shift = None
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def update(self, value: float) -> Tuple[float, float]:
+        """
+        새 가격 추가
+
+        Args:
+            value: 가격
+
+        Returns:
+            tuple: (구간 내 백분위 0~1, z-score), 계산 불가 시 NaN
+        """
+        value = float(value)
+        if math.isnan(value):
+            return math.nan, math.nan
+
+        if self._shift is None:
+            self._shift = value
+
+        self.values.append(value)
+        self.skiplist.insert(value)
+        shifted = value - self._shift
+        self._sum += shifted
+        self._sumsq += shifted * shifted
+
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            self.skiplist.remove(old)
+            shifted_old = old - self._shift
+            self._sum -= shifted_old
+            self._sumsq -= shifted_old * shifted_old
+
+        n = len(self.values)
+        if n < self.min_periods:
+            return math.nan, math.nan
+
+        below = self.skiplist.count_less(value)
+        below_or_equal = self.skiplist.count_less(value, inclusive=True)
+        percentile = (below + 1 + below_or_equal) / 2 / n
+
+        zscore = math.nan
+        if n > 1:
+            mean = self._sum / n
+            variance = max((self._sumsq - self._sum * mean) / (n - 1), 0.0)
+            if variance > 0:
+                zscore = (shifted - mean) / math.sqrt(variance)
+
+        return percentile, zscore
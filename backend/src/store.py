@@ -0,0 +1,340 @@
+"""
+시계열 저장소 모듈
+통화쌍별 고정폭 바이너리 파일에 환율 데이터를 저장하고 numpy.memmap으로 로드
+"""
+
+import json
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 파일 헤더: magic(4) + version(2) + 헤더 길이(2) + capacity(8) + 레코드 수(8)
+_MAGIC = b'FXTS'
+_VERSION = 1
+_PREFIX = struct.Struct('<4sHHQQ')
+_ROWS_OFFSET = 16  # 레코드 수 필드 위치
+_ALIGN = 64  # 데이터 영역 정렬 단위 (bytes)
+_CAPACITY_STEP = 1024  # capacity 증가 단위 (레코드)
+
+DEFAULT_PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+SUPPORTED_TIME_UNITS = ('D', 'm', 's', 'ms')  # Date 저장 단위 (일봉 ~ 장중 데이터)
+
+
+class FXTimeSeriesStore:
+    """
+    memmap 기반 환율 시계열 저장소
+
+    통화쌍마다 하나의 파일을 사용하며, 헤더 뒤에 컬럼별 연속 영역
+    (Date: datetime64[time_unit], 가격: float64/float32)을 capacity 만큼 예약한다.
+    Date 단위는 파일 헤더에 기록되며, 단위 필드가 없던 이전 파일('<i8' epoch-day)은 일 단위로 읽는다.
+    새 데이터는 예약 영역에 제자리 추가되고, 레코드 수는 데이터 기록 후 갱신되므로
+    읽기 프로세스는 항상 완결된 구간만 보게 된다. 읽기는 OS 페이지 캐시를 공유한다.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        price_columns: tuple = DEFAULT_PRICE_COLUMNS,
+        dtype: str = 'float64',
+        time_unit: str = 'D'
+    ):
+        """
+        초기화
+
+        Args:
+            root_dir: 저장소 디렉토리
+            price_columns: 저장할 가격 컬럼명
+            dtype: 가격 컬럼 자료형 ('float64' 또는 'float32')
+            time_unit: 새 파일의 Date 저장 단위 ('D' 일봉, 'm'/'s'/'ms' 분봉 등 장중 데이터)
+        """
+        if np.dtype(dtype) not in (np.dtype('float64'), np.dtype('float32')):
+            raise ValueError(f"Unsupported price dtype: {dtype}")
+        if time_unit not in SUPPORTED_TIME_UNITS:
+            raise ValueError(f"Unsupported time unit: {time_unit}")
+
+        self.root_dir = Path(root_dir)
+        self.price_columns = tuple(price_columns)
+        self.dtype = np.dtype(dtype).newbyteorder('<')
+        self.date_dtype = np.dtype(f'<M8[{time_unit}]')
+
+    def path_for(self, currency_code: str) -> Path:
+        """
+        통화쌍 파일 경로
+
+        Args:
+            currency_code: 통화 코드 (예: 'USD/KRW')
+
+        Returns:
+            Path: 저장 파일 경로
+        """
+        return self.root_dir / f"{currency_code.replace('/', '_')}.fxts"
+
+    def exists(self, currency_code: str) -> bool:
+        """저장 파일 존재 여부"""
+        return self.path_for(currency_code).exists()
+
+    def _read_header(self, path: Path) -> Dict:
+        """
+        헤더 읽기
+
+        Args:
+            path: 저장 파일 경로
+
+        Returns:
+            dict: {'capacity', 'rows', 'columns': [(name, dtype)], 'data_offset'}
+        """
+        with open(path, 'rb') as f:
+            magic, version, header_len, capacity, rows = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"Invalid time-series file: {path}")
+            descr = json.loads(f.read(header_len - _PREFIX.size).rstrip(b' ').decode('utf-8'))
+
+        # 이전 형식의 Date('<i8' epoch-day)는 같은 바이트를 일 단위 datetime64로 해석
+        columns = [
+            (name, np.dtype('<M8[D]') if name == 'Date' and code == '<i8' else np.dtype(code))
+            for name, code in descr
+        ]
+        return {
+            'capacity': capacity,
+            'rows': rows,
+            'columns': columns,
+            'data_offset': header_len
+        }
+
+    def _column_offsets(self, header: Dict) -> Dict[str, int]:
+        """컬럼별 데이터 영역 시작 위치"""
+        offsets = {}
+        offset = header['data_offset']
+        for name, dtype in header['columns']:
+            offsets[name] = offset
+            offset += dtype.itemsize * header['capacity']
+        return offsets
+
+    def _create(self, path: Path, columns: Dict[str, np.ndarray], capacity: int):
+        """
+        새 파일 생성 (임시 파일에 기록 후 원자적 교체)
+
+        Args:
+            path: 저장 파일 경로
+            columns: {컬럼명: 배열} (Date 포함)
+            capacity: 예약 레코드 수
+        """
+        descr = [['Date', columns['Date'].dtype.str]] + [[name, self.dtype.str] for name in self.price_columns]
+        body = json.dumps(descr).encode('utf-8')
+        header_len = -(-(_PREFIX.size + len(body)) // _ALIGN) * _ALIGN
+        rows = len(columns['Date'])
+
+        header = {
+            'capacity': capacity,
+            'rows': rows,
+            'columns': [(name, np.dtype(code)) for name, code in descr],
+            'data_offset': header_len
+        }
+        offsets = self._column_offsets(header)
+        file_size = header_len + sum(dtype.itemsize for _, dtype in header['columns']) * capacity
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 동시에 같은 통화쌍을 쓰는 프로세스끼리 임시 파일이 겹치지 않도록 고유 이름 사용
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.' + path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_PREFIX.pack(_MAGIC, _VERSION, header_len, capacity, rows))
+                f.write(body.ljust(header_len - _PREFIX.size, b' '))
+                f.truncate(file_size)
+
+            if rows:
+                for name, dtype in header['columns']:
+                    mm = np.memmap(tmp_path, dtype=dtype, mode='r+', offset=offsets[name], shape=(rows,))
+                    mm[:] = columns[name]
+                    mm.flush()
+                    del mm
+
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _to_columns(self, df: pd.DataFrame, date_dtype: Optional[np.dtype] = None) -> Dict[str, np.ndarray]:
+        """
+        데이터프레임을 저장용 컬럼 배열로 변환
+
+        Args:
+            df: 환율 데이터프레임 (Date 컬럼 포함)
+            date_dtype: Date 저장 자료형, None이면 저장소 time_unit
+
+        Returns:
+            dict: {컬럼명: 배열}
+
+        Raises:
+            ValueError: Date가 저장 단위보다 세밀해 잘리는 경우 (예: 일 단위 파일에 분봉)
+        """
+        date_dtype = date_dtype or self.date_dtype
+        dates = df['Date'].values.astype('datetime64[ns]')
+        stored = dates.astype(date_dtype)
+        if not np.array_equal(stored.astype('datetime64[ns]'), dates):
+            raise ValueError(f"Date values are finer than the stored time unit ({date_dtype.str})")
+        columns = {
+            'Date': stored
+        }
+        for name in self.price_columns:
+            columns[name] = df[name].to_numpy(dtype=self.dtype)
+        return columns
+
+    def write(self, currency_code: str, df: pd.DataFrame):
+        """
+        전체 이력 저장 (기존 파일 교체)
+
+        Args:
+            currency_code: 통화 코드
+            df: 환율 데이터프레임 (Date 기준 정렬)
+        """
+        columns = self._to_columns(df)
+        capacity = max(_CAPACITY_STEP, -(-len(df) // _CAPACITY_STEP) * _CAPACITY_STEP)
+        self._create(self.path_for(currency_code), columns, capacity)
+
+    def append(self, currency_code: str, df: pd.DataFrame) -> int:
+        """
+        마지막 저장 시각 이후의 신규 데이터를 제자리 추가 (Date는 파일의 저장 단위로 변환)
+
+        입력에 마지막 저장 시각이 있으면 그 행은 새 값으로 덮어쓴다 (장중에 저장된 미확정 종가 보정).
+
+        Args:
+            currency_code: 통화 코드
+            df: 환율 데이터프레임 (Date 기준 정렬)
+
+        Returns:
+            int: 추가 또는 갱신된 레코드 수
+        """
+        path = self.path_for(currency_code)
+        if not path.exists():
+            self.write(currency_code, df)
+            return len(df)
+
+        header = self._read_header(path)
+        rows = header['rows']
+        date_dtype = dict(header['columns'])['Date']
+        columns = self._to_columns(df, date_dtype)
+
+        # 마지막 저장 시각부터 기록 (마지막 저장 행은 덮어쓰기)
+        overlap = 0
+        if rows:
+            last_day = np.memmap(path, dtype=date_dtype, mode='r', offset=header['data_offset'] + date_dtype.itemsize * (rows - 1), shape=(1,))[0]
+            start = int(np.searchsorted(columns['Date'], last_day, side='left'))
+            if start < len(columns['Date']) and columns['Date'][start] == last_day:
+                overlap = 1
+            columns = {name: values[start:] for name, values in columns.items()}
+
+        written = len(columns['Date'])
+        if written == 0:
+            return 0
+
+        base = rows - overlap
+        total = base + written
+
+        # 예약 영역 초과 시 capacity를 늘려 재작성
+        if total > header['capacity']:
+            existing = self.read(currency_code)
+            merged = {name: np.concatenate([existing[name][:base], columns[name]]) for name in existing}
+            capacity = -(-total * 2 // _CAPACITY_STEP) * _CAPACITY_STEP
+            self._create(path, merged, capacity)
+            return written
+
+        offsets = self._column_offsets(header)
+        for name, dtype in header['columns']:
+            mm = np.memmap(path, dtype=dtype, mode='r+', offset=offsets[name] + dtype.itemsize * base, shape=(written,))
+            mm[:] = columns[name]
+            mm.flush()
+            del mm
+
+        # 데이터 기록 후 레코드 수 갱신
+        if total != rows:
+            with open(path, 'r+b') as f:
+                f.seek(_ROWS_OFFSET)
+                f.write(struct.pack('<Q', total))
+
+        return written
+
+    def read(
+        self,
+        currency_code: str,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, np.memmap]:
+        """
+        컬럼별 읽기 전용 memmap 배열 반환 (복사 없음)
+
+        Args:
+            currency_code: 통화 코드
+            columns: 읽을 컬럼명 목록, None이면 전체
+
+        Returns:
+            dict: {컬럼명: numpy.memmap}
+        """
+        path = self.path_for(currency_code)
+        header = self._read_header(path)
+        offsets = self._column_offsets(header)
+        rows = header['rows']
+
+        result = {}
+        for name, dtype in header['columns']:
+            if columns is not None and name != 'Date' and name not in columns:
+                continue
+            if rows == 0:
+                result[name] = np.empty(0, dtype=dtype)
+            else:
+                result[name] = np.memmap(path, dtype=dtype, mode='r', offset=offsets[name], shape=(rows,))
+        return result
+
+    def load_frame(
+        self,
+        currency_code: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        저장된 이력을 데이터프레임으로 로드 (가격 컬럼은 memmap 참조)
+
+        Args:
+            currency_code: 통화 코드
+            columns: 읽을 가격 컬럼명 목록, None이면 전체
+
+        Returns:
+            pandas.DataFrame: Date 및 가격 컬럼
+        """
+        arrays = self.read(currency_code, columns)
+        data = {'Date': pd.to_datetime(np.asarray(arrays.pop('Date')))}
+        data.update(arrays)
+        return pd.DataFrame(data, copy=False)
+
+    def iter_frames(
+        self,
+        currency_code: str,
+        chunk_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        저장된 이력을 고정 크기 청크 데이터프레임으로 순회 (청크 단위로만 메모리에 적재)
+
+        Args:
+            currency_code: 통화 코드
+            chunk_size: 청크당 레코드 수
+            columns: 읽을 가격 컬럼명 목록, None이면 전체
+
+        Yields:
+            pandas.DataFrame: Date 및 가격 컬럼
+        """
+        arrays = self.read(currency_code, columns)
+        rows = len(arrays['Date'])
+        for start in range(0, rows, chunk_size):
+            stop = min(start + chunk_size, rows)
+            data = {'Date': pd.to_datetime(np.asarray(arrays['Date'][start:stop]))}
+            for name, values in arrays.items():
+                if name != 'Date':
+                    data[name] = np.array(values[start:stop])
+            yield pd.DataFrame(data, index=pd.RangeIndex(start, stop))
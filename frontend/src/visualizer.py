@@ -3,13 +3,197 @@
 Plotly를 이용한 환율 그래프 생성
 """
 
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
+import os
+import json
+import base64
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
+# plotly 6부터 숫자 배열을 base64 typed array로 직렬화
+_PLOTLY_TYPED_ARRAYS = int(plotly.__version__.split('.')[0]) >= 6
+
+
+# 페이지 공통 스타일 (Bloomberg Terminal Style)
+_BASE_CSS = """        body { font-family: 'Consolas', 'Monaco', 'Courier New', monospace; margin: 0; padding: 0; background-color: #0a0e14; color: #ff8c00; }
+        .container { max-width: 1400px; margin: 0 auto; padding: 18px; }
+        .header { text-align: center; padding: 36px 18px; background: #161b22; color: #ff8c00; border: 1px solid #30363d; border-radius: 4px; margin-bottom: 27px; }
+        .header h1 { margin: 0; font-size: 28px; font-weight: 600; letter-spacing: 0.02em; }
+        .header p { color: #8b949e; margin: 8px 0 0 0; font-size: 13px; }
+        .footer { text-align: center; padding: 18px; color: #8b949e; font-size: 12px; }"""
+
+# 차트 다크 테마 레이아웃 (Plotly.relayout 인자, JS 객체 리터럴)
+_DARK_LAYOUT_JS = """{
+                    paper_bgcolor: '#161b22',
+                    plot_bgcolor: '#1c2128',
+                    font: { color: '#e6edf3', family: 'Consolas, Monaco, Courier New, monospace', size: 12 },
+                    xaxis: { gridcolor: '#484f58', linecolor: '#586069', zerolinecolor: '#586069', tickfont: { color: '#e6edf3', size: 11 }, title: { font: { color: '#ffb86c' } } },
+                    yaxis: { gridcolor: '#484f58', linecolor: '#586069', zerolinecolor: '#586069', tickfont: { color: '#e6edf3', size: 11 }, title: { font: { color: '#ffb86c' } } },
+                    legend: { font: { color: '#e6edf3', size: 11 }, bgcolor: 'rgba(22,27,34,0.9)', borderwidth: 1, bordercolor: '#484f58' }
+                }"""
+
+# 다해상도 줌 연동 함수 (pickLevel, applyLevel, appendBars, bindPyramid)
+_PYRAMID_ZOOM_JS = """            // 화면 x 범위에 맞는 해상도 레벨 선택 (max_points 이하인 가장 세밀한 레벨, 갱신 불가 레벨 제외)
+            function pickLevel(pyramid, x0, x1) {
+                var levels = pyramid.levels.filter(function(level) { return !pyramid.stale[level]; });
+                for (var i = 0; i < levels.length; i++) {
+                    var xs = pyramid.data[levels[i]].x;
+                    var count = 0;
+                    for (var j = 0; j < xs.length; j++) {
+                        if (xs[j] >= x0 && xs[j] <= x1) count++;
+                    }
+                    if (count <= pyramid.max_points) return levels[i];
+                }
+                return levels[levels.length - 1];
+            }
+            function applyLevel(div, pyramid, level) {
+                if (div._fxLevel === level) return;
+                div._fxLevel = level;
+                var levelData = pyramid.data[level];
+                var xs = [], ys = [], indices = [];
+                pyramid.columns.forEach(function(col, idx) {
+                    xs.push(levelData.x);
+                    ys.push(levelData[col]);
+                    indices.push(idx);
+                });
+                Plotly.restyle(div, { x: xs, y: ys }, indices);
+            }
+            // 집계 구간 키 (buckets: 'M' 월, 'W-FRI' 등 주 마지막 요일)
+            var WEEKDAYS = { SUN: 0, MON: 1, TUE: 2, WED: 3, THU: 4, FRI: 5, SAT: 6 };
+            function bucketKey(bucket, x) {
+                if (bucket === 'M') return x.slice(0, 7);
+                var d = new Date(x + 'T00:00:00Z');
+                d.setUTCDate(d.getUTCDate() + (WEEKDAYS[bucket.slice(2)] - d.getUTCDay() + 7) % 7);
+                return d.toISOString().slice(0, 10);
+            }
+            // 신규 봉을 가장 세밀한 레벨에 추가하고, 거친 레벨은 해당 구간을 다시 집계
+            // (가격은 구간 마지막 값, 나머지 컬럼은 구간 평균: FXAnalyzer.build_pyramid와 동일)
+            // 마지막 봉보다 늦지 않은 봉(재접속 시 서버가 다시 보낸 봉)은 건너뛰며, 추가한 봉 수를 반환
+            function appendBars(pyramid, frame) {
+                var finest = pyramid.data[pyramid.levels[0]];
+                var start = finest.x.length;
+                var lastX = start ? finest.x[start - 1] : '';
+                frame.x.forEach(function(x, i) {
+                    if (x <= lastX) return;
+                    lastX = x;
+                    finest.x.push(x);
+                    pyramid.columns.forEach(function(col) {
+                        finest[col].push(frame.y[col] ? frame.y[col][i] : null);
+                    });
+                });
+                pyramid.levels.slice(1).forEach(function(level) {
+                    var bucket = pyramid.buckets[level];
+                    if (!bucket) {
+                        pyramid.stale[level] = true;  // 브라우저에서 집계할 수 없는 주기
+                        return;
+                    }
+                    var levelData = pyramid.data[level];
+                    for (var i = start; i < finest.x.length; i++) {
+                        var key = bucketKey(bucket, finest.x[i]);
+                        var last = levelData.x.length - 1;
+                        if (last < 0 || bucketKey(bucket, levelData.x[last]) !== key) {
+                            levelData.x.push(null);
+                            pyramid.columns.forEach(function(col) { levelData[col].push(null); });
+                            last++;
+                        }
+                        var first = i;
+                        while (first > 0 && bucketKey(bucket, finest.x[first - 1]) === key) first--;
+                        levelData.x[last] = finest.x[i];
+                        pyramid.columns.forEach(function(col, c) {
+                            if (c === 0) {
+                                levelData[col][last] = finest[col][i];
+                                return;
+                            }
+                            var sum = 0, count = 0;
+                            for (var j = first; j <= i; j++) {
+                                if (finest[col][j] !== null) { sum += finest[col][j]; count++; }
+                            }
+                            levelData[col][last] = count ? Math.round(sum / count * 10000) / 10000 : null;
+                        });
+                    }
+                });
+                return finest.x.length - start;
+            }
+            // 확대/축소 시 해상도 레벨 교체 (loadPyramid는 처음 필요할 때 한 번 호출)
+            // 실시간 갱신은 div._fxAppend(frame)으로 피라미드에 추가한 뒤 현재 레벨을 다시 그린다
+            function bindPyramid(div, loadPyramid) {
+                if (!div.on) return;
+                var pyramid = null;
+                div._fxLevel = null;
+                function getPyramid() {
+                    if (!pyramid) {
+                        pyramid = loadPyramid();
+                        pyramid.stale = {};
+                        pyramid.buckets = pyramid.buckets || {};
+                    }
+                    if (div._fxLevel === null) div._fxLevel = pyramid.levels[pyramid.levels.length - 1];
+                    return pyramid;
+                }
+                div.on('plotly_relayout', function(event) {
+                    var x0, x1;
+                    if (event['xaxis.range[0]'] !== undefined) {
+                        x0 = String(event['xaxis.range[0]']).slice(0, 10);
+                        x1 = String(event['xaxis.range[1]']).slice(0, 10);
+                    } else if (event['xaxis.range']) {
+                        x0 = String(event['xaxis.range'][0]).slice(0, 10);
+                        x1 = String(event['xaxis.range'][1]).slice(0, 10);
+                    } else if (event['xaxis.autorange']) {
+                        x0 = '0000-00-00';
+                        x1 = '9999-99-99';
+                    } else {
+                        return;
+                    }
+                    applyLevel(div, getPyramid(), pickLevel(getPyramid(), x0, x1));
+                });
+                div._fxAppend = function(frame) {
+                    var data = getPyramid();
+                    if (!appendBars(data, frame)) return;
+                    var level = div._fxLevel;
+                    if (data.stale[level]) {
+                        var range = div._fullLayout.xaxis.range;
+                        level = pickLevel(data, String(range[0]).slice(0, 10), String(range[1]).slice(0, 10));
+                    }
+                    div._fxLevel = null;  // 같은 레벨도 다시 그리기
+                    applyLevel(div, data, level);
+                };
+            }"""
+
+
+def _pyramid_bucket(rule: Optional[str]) -> Optional[str]:
+    """
+    피라미드 resample 주기를 브라우저 집계 구간 키로 변환
+    
+    월('MS', 'M', 'ME')과 주('W', 'W-FRI' 등)만 지원하며, 그 외 주기는 None
+    (실시간 갱신 시 해당 레벨은 사용하지 않는다).
+    """
+    if rule in ('MS', 'M', 'ME'):
+        return 'M'
+    if rule == 'W':
+        return 'W-SUN'
+    if rule and rule.startswith('W-') and rule[2:] in ('SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT'):
+        return rule
+    return None
+
+
+def _plotly_cdn_url() -> str:
+    """설치된 plotly.py와 같은 버전의 plotly.js CDN 주소"""
+    try:
+        from plotly.io._utils import plotly_cdn_url
+        return plotly_cdn_url()
+    except ImportError:
+        from plotly.offline import get_plotlyjs_version
+        return f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
 class FXVisualizer:
     """환율 시각화 클래스"""
     
@@ -21,6 +205,7 @@ class FXVisualizer:
             config: 그래프 설정 딕셔너리
         """
         self.config = config
+        self._skeleton_cache = {}  # 트레이스 골격 캐시 (create_trend_chart_spec)
     
     def create_trend_chart(
         self,
@@ -47,91 +232,168 @@ class FXVisualizer:
         """
         fig = go.Figure()
         
-        # 원본 환율 데이터
-        fig.add_trace(go.Scatter(
-            x=df['Date'],
-            y=df[price_column],
-            mode='lines',
-            name='환율',
-            line=dict(
-                color=self.config.get('original_color', '#2C3E50'),
-                width=self.config.get('line_width', 2)
-            ),
-            hovertemplate='%{x|%Y-%m-%d}<br>환율: %{y:,.2f}원<extra></extra>'
-        ))
-        
-        # 이동평균선들
-        for ma_name, ma_info in ma_config.items():
-            if ma_name in df.columns:
-                fig.add_trace(go.Scatter(
-                    x=df['Date'],
-                    y=df[ma_name],
-                    mode='lines',
-                    name=ma_info['label'],
-                    line=dict(
-                        color=ma_info['color'],
-                        width=ma_info.get('line_width', 1)  # 각 이동평균의 line_width 사용, 기본값 1
-                    ),
-                    hovertemplate='%{x|%Y-%m-%d}<br>' + ma_info['label'] + ': %{y:,.2f}원<extra></extra>'
-                ))
+        # 원본 환율 데이터 및 이동평균선들
+        for column, skeleton in self._line_trace_skeletons(ma_config, price_column):
+            if column in df.columns:
+                fig.add_trace(go.Scatter(x=df['Date'], y=df[column], **skeleton))
         
+        # 최고점 / 최저점 / 현재 환율 마커
+        for marker in self._marker_traces(statistics):
+            fig.add_trace(go.Scatter(**marker))
+        
+        # 레이아웃 설정 (Bloomberg Terminal: 다크 배경, 대비되는 축/그리드/글자)
+        fig.update_layout(**self._layout_spec(df, currency_name, currency_symbol))
+        
+        return fig
+    
+    def create_trend_chart_spec(
+        self,
+        df: pd.DataFrame,
+        currency_name: str,
+        currency_symbol: str,
+        ma_config: Dict,
+        statistics: Dict,
+        price_column: str = 'Close'
+    ) -> Dict:
+        """
+        환율 트렌드 차트 스펙 생성 (graph_objects 검증 생략)
+        
+        create_trend_chart와 동일한 Plotly JSON 스펙을 dict로 직접 만든다.
+        데이터는 numpy 배열 그대로 넣고, 레이아웃 템플릿과 트레이스 골격은 캐시를 재사용한다.
+        
+        Args:
+            df: 분석된 환율 데이터프레임
+            currency_name: 통화명
+            currency_symbol: 통화 심볼 (예: USD/KRW)
+            ma_config: 이동평균 설정
+            statistics: 통계 정보
+            price_column: 가격 컬럼명
+            
+        Returns:
+            dict: {'data': [...], 'layout': {...}} (plotly.io.to_html에 validate=False로 전달)
+        """
+        dates = df['Date'].to_numpy(dtype='datetime64[us]')
+        
+        data = []
+        for column, skeleton in self._line_trace_skeletons(ma_config, price_column):
+            if column in df.columns:
+                data.append({**skeleton, 'x': dates, 'y': self._typed_array(df[column].to_numpy()), 'type': 'scatter'})
+        
+        for marker in self._marker_traces(statistics):
+            marker['type'] = 'scatter'
+            data.append(marker)
+        
+        layout = self._layout_spec(df, currency_name, currency_symbol)
+        layout['template'] = self._plotly_template()
+        
+        return {'data': data, 'layout': layout}
+    
+    def _line_trace_skeletons(self, ma_config: Dict, price_column: str) -> List:
+        """
+        선 트레이스 골격 (x/y 제외 속성) 목록, ma_config별로 캐시
+        
+        Args:
+            ma_config: 이동평균 설정
+            price_column: 가격 컬럼명
+            
+        Returns:
+            list: [(컬럼명, 트레이스 속성 dict)] (환율, 이동평균 순)
+        """
+        cache = self._skeleton_cache
+        key = (price_column, repr(ma_config))
+        if key not in cache:
+            skeletons = [(price_column, {
+                'mode': 'lines',
+                'name': '환율',
+                'line': {
+                    'color': self.config.get('original_color', '#2C3E50'),
+                    'width': self.config.get('line_width', 2)
+                },
+                'hovertemplate': '%{x|%Y-%m-%d}<br>환율: %{y:,.2f}원<extra></extra>'
+            })]
+            for ma_name, ma_info in ma_config.items():
+                skeletons.append((ma_name, {
+                    'mode': 'lines',
+                    'name': ma_info['label'],
+                    'line': {
+                        'color': ma_info['color'],
+                        'width': ma_info.get('line_width', 1)  # 각 이동평균의 line_width 사용, 기본값 1
+                    },
+                    'hovertemplate': '%{x|%Y-%m-%d}<br>' + ma_info['label'] + ': %{y:,.2f}원<extra></extra>'
+                }))
+            cache[key] = skeletons
+        return cache[key]
+    
+    def _marker_traces(self, statistics: Dict) -> List[Dict]:
+        """
+        최고점 / 최저점 / 현재 환율 마커 트레이스 속성
+        
+        Args:
+            statistics: 통계 정보
+            
+        Returns:
+            list: 트레이스 속성 dict 목록
+        """
         # Pandas 3.0 호환성을 위해 Timestamp를 Python datetime으로 변환
-        max_date = statistics['max']['date']
-        min_date = statistics['min']['date']
-        if hasattr(max_date, 'to_pydatetime'):
-            max_date = max_date.to_pydatetime()
-        if hasattr(min_date, 'to_pydatetime'):
-            min_date = min_date.to_pydatetime()
-        
-        # 최고점 표시
-        fig.add_trace(go.Scatter(
-            x=[max_date],
-            y=[statistics['max']['price']],
-            mode='markers+text',
-            name='최고점',
-            marker=dict(color='red', size=10, symbol='triangle-up'),
-            text=[f"최고: {statistics['max']['price']:,.2f}원"],
-            textposition='top center',
-            hovertemplate='최고점<br>%{x|%Y-%m-%d}<br>%{y:,.2f}원<extra></extra>'
-        ))
-        
-        # 최저점 표시
-        fig.add_trace(go.Scatter(
-            x=[min_date],
-            y=[statistics['min']['price']],
-            mode='markers+text',
-            name='최저점',
-            marker=dict(color='blue', size=10, symbol='triangle-down'),
-            text=[f"최저: {statistics['min']['price']:,.2f}원"],
-            textposition='bottom center',
-            hovertemplate='최저점<br>%{x|%Y-%m-%d}<br>%{y:,.2f}원<extra></extra>'
-        ))
-        
-        # 현재 환율 마커 추가 (수직선 대신)
-        # Pandas 3.0 호환성을 위해 Timestamp를 Python datetime으로 변환
-        current_date = statistics['current']['date']
-        if hasattr(current_date, 'to_pydatetime'):
-            current_date = current_date.to_pydatetime()
-        
-        fig.add_trace(go.Scatter(
-            x=[current_date],
-            y=[statistics['current']['price']],
-            mode='markers+text',
-            name='현재',
-            marker=dict(color='green', size=12, symbol='diamond'),
-            text=[f"현재: {statistics['current']['price']:,.2f}원"],
-            textposition='middle right',
-            hovertemplate='현재<br>%{x|%Y-%m-%d}<br>%{y:,.2f}원<extra></extra>'
-        ))
+        dates = {}
+        for key in ('max', 'min', 'current'):
+            date = statistics[key]['date']
+            if hasattr(date, 'to_pydatetime'):
+                date = date.to_pydatetime()
+            dates[key] = date
         
+        return [
+            {
+                'x': [dates['max']],
+                'y': [statistics['max']['price']],
+                'mode': 'markers+text',
+                'name': '최고점',
+                'marker': {'color': 'red', 'size': 10, 'symbol': 'triangle-up'},
+                'text': [f"최고: {statistics['max']['price']:,.2f}원"],
+                'textposition': 'top center',
+                'hovertemplate': '최고점<br>%{x|%Y-%m-%d}<br>%{y:,.2f}원<extra></extra>'
+            },
+            {
+                'x': [dates['min']],
+                'y': [statistics['min']['price']],
+                'mode': 'markers+text',
+                'name': '최저점',
+                'marker': {'color': 'blue', 'size': 10, 'symbol': 'triangle-down'},
+                'text': [f"최저: {statistics['min']['price']:,.2f}원"],
+                'textposition': 'bottom center',
+                'hovertemplate': '최저점<br>%{x|%Y-%m-%d}<br>%{y:,.2f}원<extra></extra>'
+            },
+            {
+                'x': [dates['current']],
+                'y': [statistics['current']['price']],
+                'mode': 'markers+text',
+                'name': '현재',
+                'marker': {'color': 'green', 'size': 12, 'symbol': 'diamond'},
+                'text': [f"현재: {statistics['current']['price']:,.2f}원"],
+                'textposition': 'middle right',
+                'hovertemplate': '현재<br>%{x|%Y-%m-%d}<br>%{y:,.2f}원<extra></extra>'
+            }
+        ]
+    
+    def _layout_spec(self, df: pd.DataFrame, currency_name: str, currency_symbol: str) -> Dict:
+        """
+        차트 레이아웃 (Bloomberg Terminal 스타일)
+        
+        Args:
+            df: 분석된 환율 데이터프레임
+            currency_name: 통화명
+            currency_symbol: 통화 심볼
+            
+        Returns:
+            dict: 레이아웃 속성
+        """
         # 날짜 범위 계산 (좌우 여백 추가)
         date_range = (df['Date'].max() - df['Date'].min()).days
         padding_days = int(date_range * 0.02)  # 전체 범위의 2% 여백
         x_range_start = df['Date'].min() - pd.Timedelta(days=padding_days)
         x_range_end = df['Date'].max() + pd.Timedelta(days=padding_days)
         
-        # 레이아웃 설정 (Bloomberg Terminal: 다크 배경, 대비되는 축/그리드/글자)
-        fig.update_layout(
+        return dict(
             title=dict(
                 text=f"{currency_name} 환율 트렌드 및 이동평균",
                 font=dict(size=20, color='#ffb86c'),
@@ -139,7 +401,7 @@ class FXVisualizer:
                 xanchor='center'
             ),
             xaxis=dict(
-                title='',
+                title=dict(text=''),
                 showgrid=True,
                 gridwidth=1,
                 gridcolor='#484f58',
@@ -150,7 +412,7 @@ class FXVisualizer:
                 tickfont=dict(color='#e6edf3', size=11)
             ),
             yaxis=dict(
-                title=currency_symbol,
+                title=dict(text=currency_symbol),
                 showgrid=True,
                 gridwidth=1,
                 gridcolor='#484f58',
@@ -175,8 +437,78 @@ class FXVisualizer:
             paper_bgcolor='#161b22',
             font=dict(family='Consolas, Monaco, Courier New, monospace', color='#e6edf3', size=11)
         )
+    
+    @staticmethod
+    def _typed_array(values: np.ndarray):
+        """
+        실수 배열을 go.Figure와 같은 형식으로 변환
         
-        return fig
+        plotly 6 이상은 숫자 배열을 base64 typed array 스펙으로 직렬화하므로 동일하게 맞추고,
+        그 이전 버전은 numpy 배열을 그대로 둔다.
+        
+        Args:
+            values: 실수 배열
+            
+        Returns:
+            dict 또는 numpy.ndarray
+        """
+        if not _PLOTLY_TYPED_ARRAYS or values.size == 0 or values.dtype.kind != 'f':
+            return values
+        values = np.ascontiguousarray(values)
+        return {
+            'dtype': 'f4' if values.dtype.itemsize == 4 else 'f8',
+            'bdata': base64.b64encode(values.astype(values.dtype.newbyteorder('<'), copy=False).tobytes()).decode('ascii')
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _plotly_template() -> Dict:
+        """go.Figure가 적용하는 기본 Plotly 템플릿 (한 번만 변환)"""
+        return pio.templates[pio.templates.default].to_plotly_json()
+    
+    def create_pyramid_json(
+        self,
+        pyramid: Dict[str, pd.DataFrame],
+        ma_config: Dict,
+        max_points: int = 400,
+        price_column: str = 'Close',
+        levels: Optional[Dict[str, Optional[str]]] = None
+    ) -> str:
+        """
+        줌 연동용 다해상도 데이터 JSON 생성
+        
+        트레이스 순서는 create_trend_chart와 동일하다 (환율, 이동평균 순).
+        levels를 주면 레벨별 집계 구간(buckets)을 함께 넣어, 실시간 신규 봉을
+        브라우저에서 거친 레벨에도 반영할 수 있게 한다.
+        
+        Args:
+            pyramid: {레벨명: 데이터프레임} (세밀한 순서)
+            ma_config: 이동평균 설정
+            max_points: 화면 범위에 표시할 최대 포인트 수
+            price_column: 가격 컬럼명
+            levels: build_pyramid에 사용한 {레벨명: resample 주기}
+            
+        Returns:
+            str: <script> 태그에 삽입 가능한 JSON 문자열
+        """
+        finest = next(iter(pyramid.values()))
+        columns = [price_column] + [ma_name for ma_name in ma_config if ma_name in finest.columns]
+        
+        data = {}
+        for level_name, level_df in pyramid.items():
+            level_data = {'x': level_df['Date'].dt.strftime('%Y-%m-%d').tolist()}
+            for col in columns:
+                level_data[col] = [None if pd.isna(v) else round(float(v), 4) for v in level_df[col]]
+            data[level_name] = level_data
+        
+        payload = {
+            'levels': list(pyramid.keys()),
+            'columns': columns,
+            'max_points': max_points,
+            'buckets': {level_name: _pyramid_bucket(rule) for level_name, rule in (levels or {}).items()},
+            'data': data
+        }
+        return json.dumps(payload, separators=(',', ':')).replace('</', '<\\/')
     
     def create_summary_html(
         self,
@@ -198,24 +530,71 @@ class FXVisualizer:
             <div style="display: flex; justify-content: space-around; flex-wrap: wrap;">
                 <div class="stat-high" style="margin: 9px; padding: 13px; border-radius: 4px; min-width: 200px;">
                     <h3 style="color: #ff6b6b; margin: 0;">최고 환율</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 9px 0; color: #ff8c00;">{statistics['max']['price']:,.2f}원</p>
-                    <p style="color: #8b949e; margin: 0;">{statistics['max']['formatted_date']}</p>
+                    <p style="font-size: 24px; font-weight: bold; margin: 9px 0; color: #ff8c00;" data-stat="max-price">{statistics['max']['price']:,.2f}원</p>
+                    <p style="color: #8b949e; margin: 0;" data-stat="max-date">{statistics['max']['formatted_date']}</p>
                 </div>
                 <div class="stat-low" style="margin: 9px; padding: 13px; border-radius: 4px; min-width: 200px;">
                     <h3 style="color: #5dd0f5; margin: 0;">최저 환율</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 9px 0; color: #ff8c00;">{statistics['min']['price']:,.2f}원</p>
-                    <p style="color: #8b949e; margin: 0;">{statistics['min']['formatted_date']}</p>
+                    <p style="font-size: 24px; font-weight: bold; margin: 9px 0; color: #ff8c00;" data-stat="min-price">{statistics['min']['price']:,.2f}원</p>
+                    <p style="color: #8b949e; margin: 0;" data-stat="min-date">{statistics['min']['formatted_date']}</p>
                 </div>
                 <div class="stat-current" style="margin: 9px; padding: 13px; border-radius: 4px; min-width: 200px;">
                     <h3 style="color: #7ee787; margin: 0;">현재 환율</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 9px 0; color: #ff8c00;">{statistics['current']['price']:,.2f}원</p>
-                    <p style="color: #8b949e; margin: 0;">{statistics['current']['formatted_date']}</p>
+                    <p style="font-size: 24px; font-weight: bold; margin: 9px 0; color: #ff8c00;" data-stat="current-price">{statistics['current']['price']:,.2f}원</p>
+                    <p style="color: #8b949e; margin: 0;" data-stat="current-date">{statistics['current']['formatted_date']}</p>
                 </div>
             </div>
+            {self._percentile_html(statistics.get('percentile'))}
+            {self._risk_html(statistics.get('risk'))}
         </div>
         """
         return html
     
+    def _percentile_html(self, percentile: Optional[Dict]) -> str:
+        """
+        이동 구간 백분위 / z-score 한 줄 요약 HTML
+        
+        Args:
+            percentile: {구간명: {'rank': 0~1, 'zscore'}} (없으면 빈 문자열)
+            
+        Returns:
+            str: HTML 문자열
+        """
+        if not percentile:
+            return ""
+        
+        items = []
+        for name, values in percentile.items():
+            rank = '-' if pd.isna(values['rank']) else f"{values['rank'] * 100:.0f}%"
+            zscore = '-' if pd.isna(values['zscore']) else f"{values['zscore']:+.2f}"
+            items.append(f'<span>{name} 백분위: <b style="color: #e6edf3;">{rank}</b> (z {zscore})</span>')
+        
+        return f"""
+            <div style="display: flex; justify-content: space-around; flex-wrap: wrap; margin-top: 9px; color: #8b949e; font-size: 13px;">
+                {''.join(items)}
+            </div>"""
+    
+    def _risk_html(self, risk: Optional[Dict]) -> str:
+        """
+        리스크 지표 한 줄 요약 HTML
+        
+        Args:
+            risk: FXAnalyzer.calculate_risk_metrics의 통화별 summary (없으면 빈 문자열)
+            
+        Returns:
+            str: HTML 문자열
+        """
+        if not risk:
+            return ""
+        
+        return f"""
+            <div style="display: flex; justify-content: space-around; flex-wrap: wrap; margin-top: 9px; color: #8b949e; font-size: 13px;">
+                <span>연율 변동성: <b style="color: #e6edf3;">{risk['volatility']:.2f}%</b></span>
+                <span>최대 낙폭: <b style="color: #ff6b6b;">{risk['max_drawdown']:.2f}%</b> (고점→{'회복' if risk['max_drawdown_recovered'] else '현재'} {risk['max_drawdown_duration']}거래일)</span>
+                <span>현재 낙폭: <b style="color: #e6edf3;">{risk['current_drawdown']:.2f}%</b> ({risk['current_drawdown_duration']}거래일)</span>
+                <span>VaR {risk['var_confidence'] * 100:.0f}%: <b style="color: #ffb86c;">{risk['var']:.2f}%</b></span>
+            </div>"""
+    
     def save_to_html(
         self,
         fig: go.Figure,
@@ -284,51 +663,259 @@ class FXVisualizer:
         
         print(f"HTML 파일이 생성되었습니다: {output_path}")
     
+    @contextmanager
+    def _atomic_writer(self, output_path: str):
+        """
+        원자적 파일 쓰기 컨텍스트
+        
+        같은 디렉토리의 임시 파일에 기록한 뒤 완료 시 output_path로 교체하므로
+        읽는 쪽은 완성된 파일만 보게 된다. 실패 시 임시 파일은 삭제된다.
+        
+        Args:
+            output_path: 출력 파일 경로
+        """
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                yield f
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def create_currency_fragment(self, data: Dict) -> str:
+        """
+        통화별 본문 HTML 조각 생성 (요약, 차트, 다해상도 데이터)
+        
+        Args:
+            data: {'figure': fig 또는 스펙 dict, 'summary': html, 'pyramid': json(선택)}
+            
+        Returns:
+            str: HTML 문자열
+        """
+        # 그래프 HTML 생성
+        graph_html = pio.to_html(data['figure'], include_plotlyjs='cdn', full_html=False, config={'responsive': True}, validate=False)
+        
+        # 다해상도 데이터 (확대 시 세밀한 레벨로 교체)
+        pyramid_html = ""
+        if data.get('pyramid'):
+            pyramid_html = f'<script type="application/json" class="pyramid-data">{data["pyramid"]}</script>'
+        
+        return f"""{data['summary']}
+            
+            <div class="chart-container">
+                {graph_html}
+            </div>
+            {pyramid_html}"""
+    
+    def save_currency_fragment(self, currency_code: str, data: Dict, output_path: str, price_column: str = 'Close'):
+        """
+        통화별 본문 조각을 파일로 저장 (워커 모드, 원자적 교체)
+        
+        조립 시 개요 페이지와 통계 내보내기에 쓸 수 있도록 통계와 표시 기간 종가도 함께 저장한다.
+        
+        Args:
+            currency_code: 통화 코드
+            data: create_currency_fragment 입력과 동일 (+ 'info', 'statistics', 'df')
+            output_path: 출력 파일 경로 (.json)
+            price_column: 가격 컬럼명
+        """
+        def encode(value):
+            # Timestamp는 ISO 문자열, numpy 스칼라는 파이썬 값으로 저장
+            if isinstance(value, pd.Timestamp):
+                return value.isoformat()
+            if isinstance(value, np.generic):
+                return value.item()
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+        
+        payload = {
+            'currency': currency_code,
+            'info': data['info'],
+            'fragment': self.create_currency_fragment(data),
+            'statistics': data['statistics'],
+            'prices': data['df'][price_column].tolist()
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with self._atomic_writer(output_path) as f:
+            json.dump(payload, f, ensure_ascii=False, default=encode)
+    
+    def load_currency_fragment(self, path: str, price_column: str = 'Close') -> Dict:
+        """
+        저장된 통화별 본문 조각 로드
+        
+        Args:
+            path: save_currency_fragment로 저장한 파일 경로
+            price_column: 가격 컬럼명
+            
+        Returns:
+            dict: save_multi_currency_html의 charts_data 항목 {'fragment', 'info'}
+                  + 개요 행 입력 {'statistics', 'df'} (df는 가격 컬럼만 포함)
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        
+        # 저장 시 문자열로 바꾼 날짜 복원
+        statistics = payload['statistics']
+        for key in ('max', 'min', 'current'):
+            statistics[key]['date'] = pd.Timestamp(statistics[key]['date'])
+        risk = statistics.get('risk')
+        if risk and risk.get('max_drawdown_date') is not None:
+            risk['max_drawdown_date'] = pd.Timestamp(risk['max_drawdown_date'])
+        
+        return {
+            'fragment': payload['fragment'],
+            'info': payload['info'],
+            'statistics': statistics,
+            'df': pd.DataFrame({price_column: payload['prices']})
+        }
+    
+    def _live_client_script(self, live_url: str) -> str:
+        """
+        실시간 갱신 클라이언트 스크립트
+        
+        서버의 delta 프레임을 다해상도 피라미드에 추가해 표시 중인 레벨을 다시 그리고
+        (피라미드가 없으면 Plotly.extendTraces로 트레이스를 늘린다) 요약 카드 값을 제자리에서 갱신한다. 연결이 끊기면 재접속한다.
+        
+        Args:
+            live_url: WebSocket 주소
+            
+        Returns:
+            str: <script> HTML
+        """
+        return f"""
+    <script>
+        (function() {{
+            var LIVE_URL = {json.dumps(live_url)};
+            var retryDelay = 1000;
+            
+            function formatPrice(price) {{
+                return price.toLocaleString('en-US', {{ minimumFractionDigits: 2, maximumFractionDigits: 2 }}) + '원';
+            }}
+            
+            function applyDelta(frame) {{
+                var container = document.getElementById('currency-' + frame.currency);
+                if (!container) return;
+                
+                // 신규 봉 / 이동평균 추가 (트레이스 순서: 환율, 이동평균)
+                // 다해상도 차트는 피라미드에 추가한 뒤 현재 표시 중인 레벨로 다시 그린다
+                var div = container.querySelector('.plotly-graph-div');
+                if (frame.x.length && div && div._fxAppend) {{
+                    div._fxAppend(frame);
+                }} else if (frame.x.length && div && window.Plotly) {{
+                    // 차트의 마지막 날짜보다 늦은 봉만 추가 (재접속 시 다시 받은 봉 제외)
+                    var traceX = div.data[0].x;
+                    var lastX = traceX.length ? String(traceX[traceX.length - 1]).slice(0, 10) : '';
+                    var keep = [];
+                    frame.x.forEach(function(x, i) {{
+                        if (x > lastX) {{
+                            keep.push(i);
+                            lastX = x;
+                        }}
+                    }});
+                    if (keep.length) {{
+                        var xs = [], ys = [], indices = [];
+                        frame.columns.forEach(function(col, idx) {{
+                            xs.push(keep.map(function(i) {{ return frame.x[i]; }}));
+                            ys.push(keep.map(function(i) {{ return frame.y[col][i]; }}));
+                            indices.push(idx);
+                        }});
+                        Plotly.extendTraces(div, {{ x: xs, y: ys }}, indices);
+                    }}
+                }}
+                
+                // 요약 카드 갱신
+                Object.keys(frame.stats).forEach(function(key) {{
+                    var price = container.querySelector('[data-stat="' + key + '-price"]');
+                    var date = container.querySelector('[data-stat="' + key + '-date"]');
+                    if (price) price.textContent = formatPrice(frame.stats[key].price);
+                    if (date) date.textContent = frame.stats[key].formatted_date;
+                }});
+            }}
+            
+            function connect() {{
+                var socket = new WebSocket(LIVE_URL);
+                socket.onopen = function() {{ retryDelay = 1000; }};
+                socket.onmessage = function(event) {{
+                    var frame = JSON.parse(event.data);
+                    if (frame.type === 'delta') applyDelta(frame);
+                }};
+                socket.onclose = function() {{
+                    setTimeout(connect, retryDelay);
+                    retryDelay = Math.min(retryDelay * 2, 30000);
+                }};
+            }}
+            
+            if (document.readyState === 'complete') connect();
+            else window.addEventListener('load', connect);
+        }})();
+    </script>
+"""
+    
     def save_multi_currency_html(
         self,
         charts_data: Dict,
         output_path: str,
         title: str = "FX Trend Dashboard",
-        default_currency: str = 'USD/KRW'
+        default_currency: str = 'USD/KRW',
+        live_url: Optional[str] = None
     ):
         """
         다중 통화 HTML 파일로 저장
         
         Args:
-            charts_data: {currency_code: {'figure': fig, 'summary': html, 'info': info, 'statistics': stats}}
+            charts_data: {currency_code: {'figure': fig 또는 스펙 dict, 'summary': html, 'info': info, 'statistics': stats, 'pyramid': json(선택)}}
+                또는 미리 생성한 본문 조각 {currency_code: {'fragment': html, 'info': info}}
+            output_path: 출력 파일 경로
+            title: 페이지 제목
+            default_currency: 기본 선택 통화
+            live_url: 실시간 갱신 WebSocket 주소 (예: ws://127.0.0.1:8765), None이면 정적 페이지
+        """
+        currencies = {currency_code: data['info'] for currency_code, data in charts_data.items()}
+        with self.open_multi_currency_html(output_path, currencies, title, default_currency, live_url) as write:
+            for currency_code, data in charts_data.items():
+                write(currency_code, data)
+    
+    @contextmanager
+    def open_multi_currency_html(
+        self,
+        output_path: str,
+        currencies: Dict[str, Dict],
+        title: str = "FX Trend Dashboard",
+        default_currency: str = 'USD/KRW',
+        live_url: Optional[str] = None
+    ):
+        """
+        다중 통화 HTML 스트리밍 저장 컨텍스트
+        
+        머리는 열 때, 통화별 본문은 write(currency_code, data) 호출 즉시, 꼬리는 닫을 때
+        임시 파일에 기록하고 원자적으로 교체한다. 통화 순서는 currencies 순서로 선택 목록에
+        표시되며, 본문이 기록되지 않은 통화(처리 실패)는 페이지 로드 시 선택 목록에서 제거된다.
+        
+        Args:
             output_path: 출력 파일 경로
+            currencies: {currency_code: info} 선택 목록에 표시할 통화 (info['name'] 사용)
             title: 페이지 제목
             default_currency: 기본 선택 통화
+            live_url: 실시간 갱신 WebSocket 주소, None이면 정적 페이지
+            
+        Yields:
+            callable: write(currency_code, data) (data는 save_multi_currency_html의 charts_data 항목)
         """
         # 현재 시간
         generated_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # 통화 선택 옵션 생성
-        currency_options = ""
-        for currency_code, data in charts_data.items():
+        option_lines = []
+        for currency_code, info in currencies.items():
             selected = "selected" if currency_code == default_currency else ""
-            currency_options += f'<option value="{currency_code}" {selected}>{data["info"]["name"]} ({currency_code})</option>\n'
-        
-        # 각 통화별 컨텐츠 생성
-        currency_contents = ""
-        for currency_code, data in charts_data.items():
-            display_style = "block" if currency_code == default_currency else "none"
-            
-            # 그래프 HTML 생성
-            graph_html = data['figure'].to_html(include_plotlyjs='cdn', full_html=False, config={'responsive': True})
-            
-            currency_contents += f"""
-        <div id="currency-{currency_code}" class="currency-content" style="display: {display_style};">
-            {data['summary']}
-            
-            <div class="chart-container">
-                {graph_html}
-            </div>
-        </div>
-"""
+            option_lines.append(f'<option value="{currency_code}" {selected}>{info["name"]} ({currency_code})</option>\n')
+        currency_options = "".join(option_lines)
         
-        # 전체 HTML 구성
-        html_content = f"""
+        # 페이지 머리 (스타일, 스크립트, 헤더, 통화 선택)
+        html_header = f"""
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -337,11 +924,7 @@ class FXVisualizer:
     <title>{title}</title>
     <style>
         /* Bloomberg Terminal Style */
-        body {{ font-family: 'Consolas', 'Monaco', 'Courier New', monospace; margin: 0; padding: 0; background-color: #0a0e14; color: #ff8c00; }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 18px; }}
-        .header {{ text-align: center; padding: 36px 18px; background: #161b22; color: #ff8c00; border: 1px solid #30363d; border-radius: 4px; margin-bottom: 27px; }}
-        .header h1 {{ margin: 0; font-size: 28px; font-weight: 600; letter-spacing: 0.02em; }}
-        .header p {{ color: #8b949e; margin: 8px 0 0 0; font-size: 13px; }}
+{_BASE_CSS}
         .currency-selector {{ text-align: center; margin-bottom: 27px; padding: 18px; background-color: #161b22; border: 1px solid #30363d; border-radius: 4px; }}
         .currency-selector label {{ font-size: 14px; font-weight: bold; color: #ffb86c; margin-right: 12px; }}
         .currency-selector select {{ padding: 8px 16px; font-size: 14px; font-family: 'Consolas', 'Monaco', 'Courier New', monospace; border: 1px solid #30363d; border-radius: 4px; background-color: #0d1117; color: #ff8c00; cursor: pointer; min-width: 250px; }}
@@ -398,8 +981,10 @@ class FXVisualizer:
             </select>
         </div>
         
-        {currency_contents}
+"""
         
+        # 페이지 꼬리 (푸터, 테마 스크립트)
+        html_footer = f"""        
         <div class="footer">
             <p>데이터 출처: FinanceDataReader</p>
             <p>생성 일시: {generated_time}</p>
@@ -410,14 +995,7 @@ class FXVisualizer:
         (function() {{
             function applyBloombergTheme() {{
                 var plotlyDivs = document.querySelectorAll('.plotly-graph-div');
-                var darkLayout = {{
-                    paper_bgcolor: '#161b22',
-                    plot_bgcolor: '#1c2128',
-                    font: {{ color: '#e6edf3', family: 'Consolas, Monaco, Courier New, monospace', size: 12 }},
-                    xaxis: {{ gridcolor: '#484f58', linecolor: '#586069', zerolinecolor: '#586069', tickfont: {{ color: '#e6edf3', size: 11 }}, title: {{ font: {{ color: '#ffb86c' }} }} }},
-                    yaxis: {{ gridcolor: '#484f58', linecolor: '#586069', zerolinecolor: '#586069', tickfont: {{ color: '#e6edf3', size: 11 }}, title: {{ font: {{ color: '#ffb86c' }} }} }},
-                    legend: {{ font: {{ color: '#e6edf3', size: 11 }}, bgcolor: 'rgba(22,27,34,0.9)', borderwidth: 1, bordercolor: '#484f58' }}
-                }};
+                var darkLayout = {_DARK_LAYOUT_JS};
                 plotlyDivs.forEach(function(div) {{
                     if (window.Plotly && div.id) Plotly.relayout(div.id, darkLayout);
                 }});
@@ -426,12 +1004,416 @@ class FXVisualizer:
             else window.addEventListener('load', function() {{ setTimeout(applyBloombergTheme, 50); }});
         }})();
     </script>
+    <script>
+        (function() {{
+{_PYRAMID_ZOOM_JS}
+            function init() {{
+                document.querySelectorAll('.currency-content').forEach(function(container) {{
+                    var script = container.querySelector('script.pyramid-data');
+                    var div = container.querySelector('.plotly-graph-div');
+                    if (!script || !div) return;
+                    bindPyramid(div, function() {{ return JSON.parse(script.textContent); }});
+                }});
+            }}
+            if (document.readyState === 'complete') init();
+            else window.addEventListener('load', init);
+        }})();
+    </script>
 </body>
 </html>
 """
         
-        # 파일로 저장
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        written = set()
+        
+        def write(currency_code: str, data: Dict):
+            display_style = "block" if currency_code == default_currency else "none"
+            
+            # 통화별 본문 (워커가 미리 만든 조각이 있으면 그대로 사용)
+            fragment = data.get('fragment')
+            if fragment is None:
+                fragment = self.create_currency_fragment(data)
+            
+            f.write(f"""
+        <div id="currency-{currency_code}" class="currency-content" style="display: {display_style};">
+            {fragment}
+        </div>
+""")
+            written.add(currency_code)
+        
+        # 임시 파일에 순차 기록 후 원자적 교체 (통화별 본문은 생성 즉시 기록)
+        with self._atomic_writer(output_path) as f:
+            f.write(html_header)
+            
+            yield write
+            
+            # 본문이 없는 통화는 선택 목록에서 제거하고 남은 첫 통화를 표시
+            missing = [currency_code for currency_code in currencies if currency_code not in written]
+            if missing:
+                f.write(f"""
+    <script>
+        {json.dumps(missing)}.forEach(function(code) {{
+            var option = document.querySelector('#currency-selector option[value="' + code + '"]');
+            if (option) option.remove();
+        }});
+        changeCurrency();
+    </script>
+""")
+            
+            if live_url:
+                f.write(self._live_client_script(live_url))
+            
+            f.write(html_footer)
         
         print(f"다중 통화 HTML 파일이 생성되었습니다: {output_path}")
+    
+    def create_sparkline_svg(
+        self,
+        values: np.ndarray,
+        width: int = 120,
+        height: int = 28,
+        points: int = 60
+    ) -> str:
+        """
+        인라인 SVG 스파크라인 생성
+        
+        구간별 최저/최고 값만 남겨 points개 이하로 줄이므로 급등락이 사라지지 않는다.
+        
+        Args:
+            values: 가격 배열 (Date 순)
+            width: 너비 (px)
+            height: 높이 (px)
+            points: 최대 포인트 수
+            
+        Returns:
+            str: <svg> HTML (값이 2개 미만이면 빈 문자열)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) < 2:
+            return ""
+        
+        # 구간별 최저/최고를 시간 순서대로 유지
+        if len(values) > points:
+            bounds = np.linspace(0, len(values), points // 2 + 1).astype(int)
+            picked = []
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                segment = values[start:stop]
+                lo, hi = int(np.argmin(segment)), int(np.argmax(segment))
+                picked.extend(segment[sorted((lo, hi))] if lo != hi else segment[[lo]])
+            values = np.array(picked)
+        
+        low, high = values.min(), values.max()
+        span = (high - low) or 1.0
+        xs = np.linspace(1, width - 1, len(values))
+        ys = (height - 1) - (values - low) / span * (height - 2)
+        coords = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+        
+        # 상승: 최고 환율 색상, 하락: 최저 환율 색상
+        color = '#ff6b6b' if values[-1] >= values[0] else '#5dd0f5'
+        return (
+            f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+            f'<polyline fill="none" stroke="{color}" stroke-width="1.2" points="{coords}"/></svg>'
+        )
+    
+    def save_chart_script(self, currency_code: str, data: Dict, output_path: str):
+        """
+        통화별 전체 차트를 스크립트 파일로 저장 (개요 페이지에서 클릭 시 로드, 원자적 교체)
+        
+        fetch()는 file:// 에서 막히므로 <script src>로 불러올 수 있도록
+        window.FX_CHARTS[currency_code]에 {'figure', 'pyramid'}를 등록하는 JS로 기록한다.
+        
+        Args:
+            currency_code: 통화 코드 (등록 키)
+            data: {'figure': fig 또는 스펙 dict, 'pyramid': json(선택)}
+            output_path: 출력 파일 경로 (.js)
+        """
+        figure_json = pio.to_json(data['figure'], validate=False)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with self._atomic_writer(output_path) as f:
+            f.write('window.FX_CHARTS = window.FX_CHARTS || {};\n')
+            f.write(f'window.FX_CHARTS[{json.dumps(currency_code)}] = {{"figure":')
+            f.write(figure_json)
+            f.write(',"pyramid":')
+            f.write(data.get('pyramid') or 'null')
+            f.write('};\n')
+    
+    def create_overview_row(
+        self,
+        currency_code: str,
+        data: Dict,
+        chart_url: str,
+        sparkline: Optional[Dict] = None,
+        price_column: str = 'Close'
+    ) -> str:
+        """
+        개요 표의 통화별 행 HTML 생성
+        
+        Args:
+            currency_code: 통화 코드
+            data: {'info', 'statistics', 'df'} (render_currency 결과)
+            chart_url: 전체 차트 스크립트 주소 (개요 페이지 기준 상대 경로)
+            sparkline: create_sparkline_svg 인자 {'width', 'height', 'points'}
+            price_column: 가격 컬럼명
+            
+        Returns:
+            str: <tr> HTML
+        """
+        statistics = data['statistics']
+        prices = data['df'][price_column].to_numpy(dtype=np.float64)
+        current = float(statistics['current']['price'])
+        change = (prices[-1] / prices[0] - 1) * 100 if len(prices) > 1 else float('nan')
+        change_1d = (prices[-1] / prices[-2] - 1) * 100 if len(prices) > 1 else float('nan')
+        
+        def pct_cell(value):
+            if np.isnan(value):
+                return '<td class="num">-</td>'
+            css = 'up' if value > 0 else 'down' if value < 0 else ''
+            return f'<td class="num {css}">{value:+.2f}%</td>'
+        
+        return f"""            <tr data-code="{currency_code}" data-name="{data['info']['name']}" data-chart="{chart_url}" data-current="{current}" data-change1d="{change_1d}" data-change="{change}" data-max="{float(statistics['max']['price'])}" data-min="{float(statistics['min']['price'])}">
+                <td><b>{currency_code}</b><br><span class="name">{data['info']['name']}</span></td>
+                <td>{self.create_sparkline_svg(prices, **(sparkline or {}))}</td>
+                <td class="num">{current:,.2f}<br><span class="date">{statistics['current']['formatted_date']}</span></td>
+                {pct_cell(change_1d)}
+                {pct_cell(change)}
+                <td class="num">{float(statistics['max']['price']):,.2f}<br><span class="date">{statistics['max']['formatted_date']}</span></td>
+                <td class="num">{float(statistics['min']['price']):,.2f}<br><span class="date">{statistics['min']['formatted_date']}</span></td>
+            </tr>
+"""
+    
+    def save_overview_html(
+        self,
+        charts_data: Dict,
+        output_path: str,
+        chart_urls: Dict[str, str],
+        title: str = "FX Trend Overview",
+        period_label: str = "기간",
+        sparkline: Optional[Dict] = None
+    ):
+        """
+        전체 통화 개요 페이지 저장 (정렬 가능한 표 + 스파크라인, 차트는 클릭 시 로드)
+        
+        Args:
+            charts_data: {currency_code: {'info', 'statistics', 'df'}}
+            output_path: 출력 파일 경로
+            chart_urls: {currency_code: 차트 스크립트 상대 경로}
+            title: 페이지 제목
+            period_label: 기간 변동률 열 이름 (예: '5년')
+            sparkline: create_sparkline_svg 인자 {'width', 'height', 'points'}
+        """
+        with self.open_overview_html(output_path, title, period_label, sparkline) as write:
+            for currency_code, data in charts_data.items():
+                write(currency_code, data, chart_urls[currency_code])
+    
+    @contextmanager
+    def open_overview_html(
+        self,
+        output_path: str,
+        title: str = "FX Trend Overview",
+        period_label: str = "기간",
+        sparkline: Optional[Dict] = None
+    ):
+        """
+        전체 통화 개요 페이지 스트리밍 저장 컨텍스트
+        
+        페이지 자체에는 Plotly를 포함하지 않으며, 행을 클릭하면 plotly.js와
+        해당 통화의 차트 스크립트(save_chart_script)를 그때 <script> 태그로 불러온다
+        (fetch를 쓰지 않으므로 file:// 로 열어도 동작한다).
+        행은 write(currency_code, data, chart_url) 호출 즉시 임시 파일에 기록되고,
+        닫을 때 원자적으로 교체된다.
+        
+        Args:
+            output_path: 출력 파일 경로
+            title: 페이지 제목
+            period_label: 기간 변동률 열 이름 (예: '5년')
+            sparkline: create_sparkline_svg 인자 {'width', 'height', 'points'}
+            
+        Yields:
+            callable: write(currency_code, data, chart_url) (data는 {'info', 'statistics', 'df'})
+        """
+        generated_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        html_header = f"""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        /* Bloomberg Terminal Style */
+{_BASE_CSS}
+        .detail {{ display: none; background-color: #161b22; padding: 18px; border: 1px solid #30363d; border-radius: 4px; margin-bottom: 27px; }}
+        .detail h2 {{ margin: 0 0 12px 0; font-size: 18px; color: #ffb86c; }}
+        .detail-chart {{ min-height: 600px; color: #8b949e; }}
+        table.overview {{ width: 100%; border-collapse: collapse; background-color: #161b22; border: 1px solid #30363d; font-size: 13px; }}
+        table.overview th {{ position: sticky; top: 0; background-color: #0d1117; color: #ffb86c; padding: 9px; border-bottom: 1px solid #30363d; cursor: pointer; user-select: none; text-align: left; white-space: nowrap; }}
+        table.overview th[data-order="asc"]::after {{ content: " ▲"; }}
+        table.overview th[data-order="desc"]::after {{ content: " ▼"; }}
+        table.overview td {{ padding: 6px 9px; border-bottom: 1px solid #21262d; color: #e6edf3; vertical-align: middle; }}
+        table.overview tbody tr {{ cursor: pointer; }}
+        table.overview tbody tr:hover {{ background-color: #1c2128; }}
+        table.overview tbody tr.selected {{ background-color: #1a1210; }}
+        table.overview .num {{ text-align: right; font-variant-numeric: tabular-nums; }}
+        table.overview .up {{ color: #ff6b6b; }}
+        table.overview .down {{ color: #5dd0f5; }}
+        table.overview .name, table.overview .date {{ color: #8b949e; font-size: 11px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>💱 {title}</h1>
+            <p>전체 통화 개요 (행을 클릭하면 차트를 불러옵니다)</p>
+        </div>
+        
+        <div id="detail" class="detail">
+            <h2 id="detail-title"></h2>
+            <div id="detail-chart" class="detail-chart"></div>
+        </div>
+        
+        <table id="overview" class="overview">
+            <thead>
+                <tr>
+                    <th data-key="code" data-type="text">통화</th>
+                    <th>추이</th>
+                    <th data-key="current" data-type="number" class="num">현재</th>
+                    <th data-key="change1d" data-type="number" class="num">1일 %</th>
+                    <th data-key="change" data-type="number" class="num">{period_label} %</th>
+                    <th data-key="max" data-type="number" class="num">최고</th>
+                    <th data-key="min" data-type="number" class="num">최저</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+        
+        html_footer = f"""            </tbody>
+        </table>
+        
+        <div class="footer">
+            <p>데이터 출처: FinanceDataReader</p>
+            <p>생성 일시: {generated_time}</p>
+            <p>© 2026 FX Trend Dashboard</p>
+        </div>
+    </div>
+    <script>
+        (function() {{
+            var PLOTLY_URL = {json.dumps(_plotly_cdn_url())};
+            var darkLayout = {_DARK_LAYOUT_JS};
+{_PYRAMID_ZOOM_JS}
+            
+            // plotly.js / 차트 스크립트는 처음 필요할 때 한 번만 로드 (file:// 에서도 동작하도록 <script> 사용)
+            var plotlyLoading = null;
+            var chartLoading = {{}};
+            function loadScript(url) {{
+                return new Promise(function(resolve, reject) {{
+                    var script = document.createElement('script');
+                    script.src = url;
+                    script.onload = resolve;
+                    script.onerror = function() {{
+                        script.remove();
+                        reject(new Error(url));
+                    }};
+                    document.head.appendChild(script);
+                }});
+            }}
+            function loadPlotly() {{
+                if (window.Plotly) return Promise.resolve();
+                if (!plotlyLoading) plotlyLoading = loadScript(PLOTLY_URL);
+                return plotlyLoading;
+            }}
+            function loadChart(code, url) {{
+                if (!chartLoading[code]) {{
+                    chartLoading[code] = loadScript(url).then(function() {{
+                        var payload = window.FX_CHARTS && window.FX_CHARTS[code];
+                        if (!payload) throw new Error(code);
+                        return payload;
+                    }});
+                    chartLoading[code].catch(function() {{ delete chartLoading[code]; }});  // 실패 시 다음 클릭에 재시도
+                }}
+                return chartLoading[code];
+            }}
+            
+            var selected = null;
+            function showChart(row) {{
+                var panel = document.getElementById('detail');
+                var holder = document.getElementById('detail-chart');
+                if (selected) selected.classList.remove('selected');
+                selected = row;
+                row.classList.add('selected');
+                document.getElementById('detail-title').textContent = row.dataset.name + ' (' + row.dataset.code + ')';
+                panel.style.display = 'block';
+                panel.scrollIntoView({{ behavior: 'smooth' }});
+                
+                var previous = holder.querySelector('.js-plotly-plot');
+                if (previous && window.Plotly) Plotly.purge(previous);
+                holder.textContent = '차트 로딩 중...';
+                
+                Promise.all([loadPlotly(), loadChart(row.dataset.code, row.dataset.chart)]).then(function(results) {{
+                    if (selected !== row) return;  // 로딩 중 다른 행을 선택한 경우
+                    var payload = results[1];
+                    holder.textContent = '';
+                    var div = document.createElement('div');
+                    holder.appendChild(div);
+                    return Plotly.newPlot(div, payload.figure.data, payload.figure.layout, {{ responsive: true }}).then(function() {{
+                        Plotly.relayout(div, darkLayout);
+                        if (payload.pyramid) bindPyramid(div, function() {{ return payload.pyramid; }});
+                    }});
+                }}).catch(function() {{
+                    if (selected === row) holder.textContent = '차트를 불러오지 못했습니다.';
+                }});
+            }}
+            
+            // 열 머리글 클릭 시 정렬 (같은 열을 다시 누르면 순서 반전)
+            function sortBy(th) {{
+                var key = th.dataset.key;
+                var numeric = th.dataset.type === 'number';
+                var ascending = th.dataset.order !== 'asc';
+                document.querySelectorAll('#overview th').forEach(function(header) {{
+                    header.removeAttribute('data-order');
+                }});
+                th.dataset.order = ascending ? 'asc' : 'desc';
+                
+                var tbody = document.querySelector('#overview tbody');
+                var rows = Array.prototype.slice.call(tbody.rows);
+                rows.sort(function(a, b) {{
+                    var va = a.dataset[key], vb = b.dataset[key];
+                    var result;
+                    if (numeric) {{
+                        va = parseFloat(va);
+                        vb = parseFloat(vb);
+                        if (isNaN(va) || isNaN(vb)) return isNaN(va) - isNaN(vb);  // 값 없음은 항상 마지막
+                        result = va - vb;
+                    }} else {{
+                        result = va.localeCompare(vb);
+                    }}
+                    return ascending ? result : -result;
+                }});
+                var fragment = document.createDocumentFragment();
+                rows.forEach(function(row) {{ fragment.appendChild(row); }});
+                tbody.appendChild(fragment);
+            }}
+            
+            document.querySelector('#overview thead').addEventListener('click', function(event) {{
+                var th = event.target.closest('th');
+                if (th && th.dataset.key) sortBy(th);
+            }});
+            document.querySelector('#overview tbody').addEventListener('click', function(event) {{
+                var row = event.target.closest('tr');
+                if (row) showChart(row);
+            }});
+        }})();
+    </script>
+</body>
+</html>
+"""
+        
+        def write(currency_code: str, data: Dict, chart_url: str):
+            f.write(self.create_overview_row(currency_code, data, chart_url, sparkline))
+        
+        with self._atomic_writer(output_path) as f:
+            f.write(html_header)
+            yield write
+            f.write(html_footer)
+        
+        print(f"개요 HTML 파일이 생성되었습니다: {output_path}")
@@ -2,10 +2,16 @@
 FX Trend Dashboard 메인 실행 파일
 """
 
+import argparse
+import asyncio
 import os
 import sys
+from datetime import timedelta
+from functools import partial
 from pathlib import Path
 
+import pandas as pd
+
 # Windows 콘솔 UTF-8 인코딩 설정
 if sys.platform == 'win32':
     import codecs
@@ -18,161 +24,688 @@ sys.path.insert(0, str(project_root))
 
 from backend.src.data_collector import FXDataCollector
 from backend.src.analyzer import FXAnalyzer
+from backend.src.store import FXTimeSeriesStore
+from backend.src.pipeline import FXPipeline
+from backend.src.exporter import FXExporter, FULL_SERIES_DATASET
+from backend.src.live_server import FXLiveServer
+from backend.src.alerts import FXAlertEngine, FileAlertSink, SocketAlertSink
+from backend.src.coordinator import FXShardCoordinator
 from frontend.src.visualizer import FXVisualizer
 import backend.config as config
 
 
-def main():
-    """메인 실행 함수"""
-    print("=" * 60)
-    print("FX Trend Dashboard 생성 시작")
-    print("=" * 60)
+# 파이프라인 단계명 (오류 메시지용)
+STAGE_LABELS = {
+    'fetch': '수집',
+    'load': '로드',
+    'analyze': '분석',
+    'render': '시각화'
+}
+
+
+def required_start_date():
+    """이동평균 계산에 필요한 시작일 (표시 기간 + warmup 기간)"""
+    total_period_years = config.DEFAULT_PERIOD_YEARS + config.MA_WARMUP_YEARS
+    return pd.Timestamp.now().normalize() - timedelta(days=total_period_years * 365)
+
+
+def display_cutoff(dates):
+    """표시 기간 시작일 (마지막 날짜 기준 DEFAULT_PERIOD_YEARS년 전)"""
+    return dates.max() - timedelta(days=config.DEFAULT_PERIOD_YEARS * 365)
+
+
+def update_store(collector, store, currency_code, currency_info):
+    """
+    수집 단계: 로컬 저장소 이력 확인 후 마지막 저장일 이후 데이터만 수집해 저장소 갱신
     
-    # 1. 모든 통화 데이터 수집
-    print("\n[1/4] 데이터 수집 중...")
-    collector = FXDataCollector()
+    저장소가 없거나 필요한 기간을 덮지 못하면 전체 기간을 수집해 저장소를 새로 만든다.
+    마지막 저장일부터 다시 받으므로 장중에 저장된 미확정 종가도 보정된다.
     
-    # 이동평균 계산을 위해 표시 기간 + warmup 기간만큼 수집
+    Args:
+        collector: FXDataCollector
+        store: FXTimeSeriesStore
+        currency_code: 통화 코드
+        currency_info: 통화 설정
+        
+    Returns:
+        dict: 통화 설정 (다음 단계 입력)
+    """
     total_period_years = config.DEFAULT_PERIOD_YEARS + config.MA_WARMUP_YEARS
+    required_start = required_start_date()
     
-    all_currency_data = {}
+    history = None
+    if store.exists(currency_code):
+        try:
+            history = store.load_frame(currency_code)
+        except Exception as e:
+            print(f"    ! {currency_info['name']} 저장소 로드 실패: {str(e)}")
     
-    for currency_code, currency_info in config.CURRENCIES.items():
+    # 저장소가 필요한 기간을 덮으면 증분 수집 (시작일 이후 첫 거래일까지 여유 허용)
+    if history is not None and len(history) and history['Date'].iloc[0] <= required_start + timedelta(days=config.STORE_START_TOLERANCE_DAYS):
+        last_date = history['Date'].iloc[-1]
+        print(f"  - {currency_info['name']} 수집 중 ({last_date.strftime('%Y-%m-%d')} 이후)...")
         try:
-            print(f"  - {currency_info['name']} 수집 중...")
-            df_all = collector.fetch_exchange_rate(
+            df_new = collector.fetch_exchange_rate(
                 currency_code=currency_info['fdr_code'],
-                period_years=total_period_years
+                start_date=last_date.strftime('%Y-%m-%d')
             )
-            all_currency_data[currency_code] = {
-                'df': df_all,
-                'info': currency_info
-            }
-            print(f"    ✓ {currency_info['name']} 데이터 수집 완료 ({len(df_all)}개 레코드)")
+            updated = store.append(currency_code, df_new)
+            print(f"    ✓ {currency_info['name']} 저장소 갱신 ({updated}개 레코드 추가/보정)")
         except Exception as e:
-            print(f"    ✗ {currency_info['name']} 수집 실패: {str(e)}")
-            continue
+            # 증분 수집 실패 시 저장된 이력으로 계속 진행
+            print(f"    ! {currency_info['name']} 증분 수집 실패, 저장된 이력 사용: {str(e)}")
+    else:
+        print(f"  - {currency_info['name']} 수집 중...")
+        df_full = collector.fetch_exchange_rate(
+            currency_code=currency_info['fdr_code'],
+            period_years=total_period_years
+        )
+        store.write(currency_code, df_full)
+        print(f"    ✓ {currency_info['name']} 데이터 수집 완료 ({len(df_full)}개 레코드, 저장소 생성)")
     
-    if not all_currency_data:
-        print("\n✗ 수집된 데이터가 없습니다.")
-        return
+    return currency_info
+
+
+def load_history(store, currency_code, currency_info):
+    """
+    로드 단계: 저장소에서 이동평균 계산에 필요한 기간의 종가만 로드 (memmap 구간 복사)
     
-    print(f"\n✓ 총 {len(all_currency_data)}개 통화 데이터 수집 완료")
-    print(f"  - 수집 기간: {total_period_years}년 (표시: {config.DEFAULT_PERIOD_YEARS}년 + 이동평균 계산용: {config.MA_WARMUP_YEARS}년)")
+    Args:
+        store: FXTimeSeriesStore
+        currency_code: 통화 코드
+        currency_info: 통화 설정
+        
+    Returns:
+        dict: {'df': 이력 데이터프레임, 'info': 통화 설정}
+    """
+    df_all = store.load_frame(currency_code, columns=['Close'])
+    df_all = df_all[df_all['Date'] >= required_start_date()].reset_index(drop=True)
     
-    # 2. 모든 통화 데이터 분석
-    print("\n[2/4] 데이터 분석 중...")
-    analyzer = FXAnalyzer()
+    return {
+        'df': df_all,
+        'info': currency_info
+    }
+
+
+def fetch_currency(collector, store, currency_code, currency_info):
+    """
+    수집 + 로드 (update_store 후 load_history)
     
-    # 이동평균 기간 추출
-    ma_periods = {name: info['days'] for name, info in config.MOVING_AVERAGES.items()}
+    Returns:
+        dict: {'df': 이력 데이터프레임, 'info': 통화 설정}
+    """
+    update_store(collector, store, currency_code, currency_info)
+    return load_history(store, currency_code, currency_info)
+
+
+def calculate_panel_risk(analyzer, store, currency_codes):
+    """
+    리스크 단계: 통화별 표시 기간 종가를 하나의 패널로 모아 리스크 지표를 한 번에 계산
     
-    from datetime import timedelta
-    analyzed_data = {}
+    종가는 저장소 memmap에서 읽으며, 계산은 통화 수와 무관하게 패널 전체에 한 번 수행된다.
     
-    for currency_code, data in all_currency_data.items():
-        try:
-            print(f"  - {data['info']['name']} 분석 중...")
-            df_all = data['df']
-            
-            # 전체 데이터로 이동평균 계산 (warmup 기간 포함)
-            df_analyzed_all = analyzer.analyze_trend(df_all, ma_periods)
-            
-            # 표시용 데이터: 최근 지정 기간만 추출
-            cutoff_date = df_analyzed_all['Date'].max() - timedelta(days=config.DEFAULT_PERIOD_YEARS * 365)
-            df_display = df_analyzed_all[df_analyzed_all['Date'] >= cutoff_date].copy()
-            
-            # 통계 분석 (표시 기간 데이터만)
-            statistics = analyzer.get_statistics(df_display)
-            
-            analyzed_data[currency_code] = {
-                'df': df_display,
-                'statistics': statistics,
-                'info': data['info']
-            }
-            
-            print(f"    ✓ 분석 완료 - 최고: {statistics['max']['price']:,.2f}원, 최저: {statistics['min']['price']:,.2f}원")
+    Args:
+        analyzer: FXAnalyzer
+        store: FXTimeSeriesStore
+        currency_codes: 통화 코드 목록
+        
+    Returns:
+        dict: {currency_code: FXAnalyzer.calculate_risk_metrics의 통화별 summary}
+    """
+    closes = {}
+    for currency_code in currency_codes:
+        df = store.load_frame(currency_code, columns=['Close'])
+        closes[currency_code] = df[df['Date'] >= display_cutoff(df['Date'])]
+    
+    panel = analyzer.build_price_panel(closes)
+    return analyzer.calculate_risk_metrics(panel, **config.RISK_CONFIG)['summary']
+
+
+def analyze_currency(analyzer, ma_periods, risk, currency_code, data):
+    """
+    분석 단계: 이동평균, 통계, 다해상도 피라미드 계산 (리스크 지표는 패널 계산 결과 사용)
+    
+    Args:
+        analyzer: FXAnalyzer
+        ma_periods: 이동평균 기간
+        risk: calculate_panel_risk 결과 {currency_code: summary} (없는 통화는 리스크 지표 생략)
+        currency_code: 통화 코드
+        data: 수집 단계 결과
+        
+    Returns:
+        dict: {'df', 'pyramid', 'statistics', 'info'}
+    """
+    print(f"  - {data['info']['name']} 분석 중...")
+    df_all = data['df']
+    
+    # 전체 데이터로 이동평균 계산 (warmup 기간 포함)
+    df_analyzed_all = analyzer.analyze_trend(df_all, ma_periods)
+    
+    # 이동 구간 백분위 / z-score (warmup 기간 포함)
+    df_analyzed_all = analyzer.calculate_rolling_percentile(df_analyzed_all, config.PERCENTILE_WINDOWS)
+    
+    # 표시용 데이터: 최근 지정 기간만 추출
+    df_display = df_analyzed_all[df_analyzed_all['Date'] >= display_cutoff(df_analyzed_all['Date'])].copy()
+    
+    # 통계 분석 (표시 기간 데이터만)
+    statistics = analyzer.get_statistics(df_display)
+    statistics['percentile'] = {
+        name: {
+            'rank': df_display[f'PCT{name}'].iloc[-1],
+            'zscore': df_display[f'ZSCORE{name}'].iloc[-1]
+        }
+        for name in config.PERCENTILE_WINDOWS
+    }
+    
+    # 리스크 지표 (전체 통화 패널에서 계산한 해당 통화 행)
+    if currency_code in risk:
+        statistics['risk'] = risk[currency_code]
+    
+    # 다해상도 피라미드 (일/주/월 집계)
+    pyramid = analyzer.build_pyramid(df_display, config.PYRAMID_LEVELS, list(ma_periods))
+    
+    print(f"    ✓ {data['info']['name']} 분석 완료 - 최고: {statistics['max']['price']:,.2f}원, 최저: {statistics['min']['price']:,.2f}원")
+    
+    return {
+        'df': df_display,
+        'pyramid': pyramid,
+        'statistics': statistics,
+        'info': data['info']
+    }
+
+
+def render_currency(visualizer, currency_code, data):
+    """
+    렌더링 단계: 차트, 요약 HTML, 피라미드 JSON 생성
+    
+    Args:
+        visualizer: FXVisualizer
+        currency_code: 통화 코드
+        data: 분석 단계 결과
+        
+    Returns:
+        dict: save_multi_currency_html의 charts_data 항목
+    """
+    print(f"  - {data['info']['name']} 그래프 생성 중...")
+    
+    # 차트 생성 방식 선택 (JSON 스펙 직접 생성 / graph_objects)
+    if config.GRAPH_CONFIG.get('fast_spec'):
+        build_chart = visualizer.create_trend_chart_spec
+    else:
+        build_chart = visualizer.create_trend_chart
+    
+    # 첫 화면은 가장 거친 레벨로 그리고, 확대 시 세밀한 레벨을 로드
+    coarsest_df = list(data['pyramid'].values())[-1]
+    
+    fig = build_chart(
+        df=coarsest_df,
+        currency_name=data['info']['name'],
+        currency_symbol=data['info']['symbol'],
+        ma_config=config.MOVING_AVERAGES,
+        statistics=data['statistics']
+    )
+    
+    summary_html = visualizer.create_summary_html(
+        statistics=data['statistics'],
+        currency_name=data['info']['name']
+    )
+    
+    pyramid_json = visualizer.create_pyramid_json(
+        pyramid=data['pyramid'],
+        ma_config=config.MOVING_AVERAGES,
+        max_points=config.PYRAMID_MAX_POINTS,
+        levels=config.PYRAMID_LEVELS
+    )
+    
+    print(f"    ✓ {data['info']['name']} 그래프 생성 완료")
+    
+    return {
+        'figure': fig,
+        'summary': summary_html,
+        'pyramid': pyramid_json,
+        'info': data['info'],
+        'statistics': data['statistics'],
+        'df': data['df']
+    }
+
+
+def create_alert_engine(ma_periods):
+    """
+    ALERT_CONFIG로 알림 엔진 생성 (출력 대상 및 통화쌍별 규칙 등록)
+    
+    Args:
+        ma_periods: 이동평균 기간
+        
+    Returns:
+        FXAlertEngine: 알림 엔진
+    """
+    sinks = []
+    if config.ALERT_CONFIG.get('log_path'):
+        Path(config.ALERT_CONFIG['log_path']).parent.mkdir(parents=True, exist_ok=True)
+        sinks.append(FileAlertSink(config.ALERT_CONFIG['log_path']))
+    if config.ALERT_CONFIG.get('udp'):
+        host, port = config.ALERT_CONFIG['udp']
+        sinks.append(SocketAlertSink(host, port))
+    
+    # 최고/최저 구간은 get_statistics 표시 기간과 동일
+    engine = FXAlertEngine(ma_periods, sinks, extreme_days=config.DEFAULT_PERIOD_YEARS * 365)
+    for currency_code in config.CURRENCIES:
+        rules = config.ALERT_CONFIG.get('default_rules', []) + config.ALERT_CONFIG.get('rules', {}).get(currency_code, [])
+        for rule_type, value in rules:
+            engine.add_rule(currency_code, rule_type, value)
+    return engine
+
+
+async def serve_live(collector, store, analyzer, ma_periods, live_data):
+    """
+    실시간 갱신 서버 실행: 주기적으로 신규 데이터를 조회해 delta 프레임 전송
+    
+    Args:
+        collector: FXDataCollector
+        store: FXTimeSeriesStore
+        analyzer: FXAnalyzer
+        ma_periods: 이동평균 기간
+        live_data: {currency_code: {'statistics', 'df'(Date, Close)}} 페이지 생성에 사용한 통화별 데이터
+    """
+    server = FXLiveServer(
+        host=config.LIVE_CONFIG['host'],
+        port=config.LIVE_CONFIG['port'],
+        min_interval=config.LIVE_CONFIG['min_interval']
+    )
+    await server.start()
+    print(f"\n✓ 실시간 갱신 서버 시작: {server.url} (종료: Ctrl+C)")
+    
+    # 이동평균 재계산용 가격 이력 (표시 기간이 최대 이동평균 기간보다 길다)
+    series = {}
+    alert_engine = create_alert_engine(ma_periods)
+    for currency_code, data in live_data.items():
+        server.set_snapshot(currency_code, data['statistics'])
+        series[currency_code] = data['df']
+        alert_engine.initialize(currency_code, series[currency_code])
+    
+    try:
+        while True:
+            await asyncio.sleep(config.LIVE_CONFIG['poll_interval'])
             
-        except Exception as e:
-            print(f"    ✗ {data['info']['name']} 분석 실패: {str(e)}")
-            continue
+            for currency_code, history in series.items():
+                info = config.CURRENCIES[currency_code]
+                last_date = history['Date'].max()
+                try:
+                    df_recent = await asyncio.to_thread(
+                        collector.fetch_exchange_rate,
+                        currency_code=info['fdr_code'],
+                        start_date=last_date.strftime('%Y-%m-%d')
+                    )
+                except Exception as e:
+                    print(f"    ✗ {info['name']} 조회 실패: {str(e)}")
+                    continue
+                
+                new_rows = df_recent[df_recent['Date'] > last_date]
+                if new_rows.empty:
+                    continue
+                
+                await asyncio.to_thread(store.append, currency_code, df_recent)
+                
+                # 신규 봉의 이동평균 계산 후 표시 기간 유지
+                history = pd.concat([history, new_rows[['Date', 'Close']]], ignore_index=True)
+                df_analyzed = analyzer.analyze_trend(history, ma_periods)
+                cutoff_date = df_analyzed['Date'].max() - timedelta(days=config.DEFAULT_PERIOD_YEARS * 365)
+                df_display = df_analyzed[df_analyzed['Date'] >= cutoff_date]
+                statistics = analyzer.get_statistics(df_display)
+                series[currency_code] = df_display[['Date', 'Close']].reset_index(drop=True)
+                
+                frame = server.make_delta_frame(
+                    currency_code,
+                    df_analyzed.tail(len(new_rows)),
+                    list(ma_periods),
+                    statistics
+                )
+                server.publish(frame)
+                print(f"  - {info['name']} 신규 {len(new_rows)}건 전송 ({len(server.clients)}개 클라이언트)")
+                
+                # 신규 봉마다 알림 평가
+                for date, price in zip(new_rows['Date'], new_rows['Close']):
+                    for event in alert_engine.update(currency_code, date, price):
+                        print(f"    🔔 {info['name']} {event['type']} {event['direction']} ({event['date']}, {event['price']:,.2f})")
+    finally:
+        await server.stop()
+
+
+def fragment_path(run_id, currency_code):
+    """워커 모드 통화별 HTML 조각 경로"""
+    return Path(config.SHARD_CONFIG['fragment_dir']) / run_id / f"{currency_code.replace('/', '_')}.json"
+
+
+def chart_script_url(currency_code):
+    """통화별 차트 스크립트 경로 (OUTPUT_DIR 기준, 개요 페이지에서 클릭 시 로드)"""
+    return f"{config.OVERVIEW_CONFIG['chart_dir']}/{currency_code.replace('/', '_')}.js"
+
+
+def run_worker(run_id):
+    """
+    워커 모드: lease를 얻은 통화쌍을 수집/분석/렌더링해 HTML 조각, 차트 스크립트, 시계열 내보내기로 저장
     
-    if not analyzed_data:
-        print("\n✗ 분석된 데이터가 없습니다.")
-        return
+    여러 프로세스/호스트에서 같은 run_id로 동시에 실행할 수 있다.
+    개요 페이지와 통계 내보내기는 전체 통화가 필요하므로 조립 모드에서 생성한다.
     
-    print(f"\n✓ 총 {len(analyzed_data)}개 통화 분석 완료")
+    Args:
+        run_id: 실행 식별자, None이면 새 실행 생성
+    """
+    if run_id is None:
+        run_id = FXShardCoordinator.new_run_id()
+    coordinator = FXShardCoordinator(
+        config.SHARD_CONFIG['db_path'],
+        run_id,
+        lease_seconds=config.SHARD_CONFIG['lease_seconds'],
+        max_attempts=config.SHARD_CONFIG['max_attempts']
+    )
+    coordinator.register(list(config.CURRENCIES))
+    print(f"워커 시작: {coordinator.owner} (run: {run_id})")
+    print(f"  - 다른 워커/조립: --run-id {run_id}")
     
-    # 3. 모든 통화 시각화
-    print("\n[3/4] 그래프 생성 중...")
+    collector = FXDataCollector()
+    store = FXTimeSeriesStore(config.STORE_DIR, dtype=config.STORE_PRICE_DTYPE, time_unit=config.STORE_TIME_UNIT)
+    analyzer = FXAnalyzer()
     visualizer = FXVisualizer(config.GRAPH_CONFIG)
+    exporter = FXExporter(config.EXPORT_DIR, config.EXPORT_FORMATS)
+    output_dir = Path(config.OUTPUT_DIR)
+    ma_periods = {name: info['days'] for name, info in config.MOVING_AVERAGES.items()}
     
-    charts_data = {}
+    def analyze_with_risk(currency_code, data):
+        # 워커는 자기 통화쌍만 다루므로 패널도 해당 통화 하나로 계산
+        try:
+            risk = calculate_panel_risk(analyzer, store, [currency_code])
+        except Exception as e:
+            risk = {}
+            print(f"    ! {data['info']['name']} 리스크 지표 계산 실패: {str(e)}")
+        return analyze_currency(analyzer, ma_periods, risk, currency_code, data)
+    
+    steps = [
+        partial(fetch_currency, collector, store),
+        analyze_with_risk,
+        partial(render_currency, visualizer)
+    ]
     
+    processed = 0
     try:
-        for currency_code, data in analyzed_data.items():
-            print(f"  - {data['info']['name']} 그래프 생성 중...")
+        while True:
+            currency_code = coordinator.claim()
+            if currency_code is None:
+                break
             
-            fig = visualizer.create_trend_chart(
-                df=data['df'],
-                currency_name=data['info']['name'],
-                currency_symbol=data['info']['symbol'],
-                ma_config=config.MOVING_AVERAGES,
-                statistics=data['statistics']
-            )
-            
-            summary_html = visualizer.create_summary_html(
-                statistics=data['statistics'],
-                currency_name=data['info']['name']
-            )
+            info = config.CURRENCIES[currency_code]
+            try:
+                # 단계마다 lease를 연장하고, lease를 잃었으면 (다른 워커가 가져감) 중단
+                data = info
+                lease_held = True
+                for step in steps:
+                    data = step(currency_code, data)
+                    lease_held = coordinator.renew(currency_code)
+                    if not lease_held:
+                        break
+                if lease_held:
+                    visualizer.save_chart_script(currency_code, data, str(output_dir / chart_script_url(currency_code)))
+                    exporter.export_series(currency_code, data['df'], list(ma_periods))
+                    visualizer.save_currency_fragment(currency_code, data, str(fragment_path(run_id, currency_code)))
+            except Exception as e:
+                print(f"    ✗ {info['name']} 처리 실패: {str(e)}")
+                coordinator.fail(currency_code, str(e))
+                continue
             
-            charts_data[currency_code] = {
-                'figure': fig,
-                'summary': summary_html,
-                'info': data['info'],
-                'statistics': data['statistics']
-            }
-            
-            print(f"    ✓ 그래프 생성 완료")
-        
-        print(f"\n✓ 총 {len(charts_data)}개 통화 그래프 생성 완료")
+            if lease_held and coordinator.complete(currency_code):
+                processed += 1
+            else:
+                print(f"    ! {info['name']} lease 만료로 중단 (다른 워커가 처리)")
+    finally:
+        coordinator.close()
+    
+    print(f"✓ 워커 종료: {processed}개 통화 처리")
+
+
+def run_assembler(run_id):
+    """
+    조립 모드: 워커가 만든 HTML 조각을 모아 대시보드 / 개요 페이지 생성 및 통계 내보내기
+    
+    Args:
+        run_id: 실행 식별자, None이면 가장 최근 실행
+    """
+    if run_id is None:
+        run_id = FXShardCoordinator.latest_run_id(config.SHARD_CONFIG['db_path'])
+        if run_id is None:
+            print("✗ 조립할 실행이 없습니다. (먼저 python main.py --worker 실행)")
+            return
+        print(f"조립 대상 실행: {run_id}")
+    coordinator = FXShardCoordinator(config.SHARD_CONFIG['db_path'], run_id)
+    status = coordinator.status()
+    coordinator.close()
+    
+    visualizer = FXVisualizer(config.GRAPH_CONFIG)
+    charts_data = {}
+    for currency_code, currency_info in config.CURRENCIES.items():
+        path = fragment_path(run_id, currency_code)
+        state = status.get(currency_code, {}).get('status', 'unregistered')
+        if state == 'done' and path.exists():
+            charts_data[currency_code] = visualizer.load_currency_fragment(str(path))
+        else:
+            print(f"  ! {currency_info['name']} 제외 (상태: {state})")
+    
+    if not charts_data:
+        print("\n✗ 조립할 통화가 없습니다.")
+        return
+    
+    output_dir = Path(config.OUTPUT_DIR)
+    output_dir.mkdir(exist_ok=True)
+    output_path = output_dir / config.OUTPUT_FILENAME
+    overview_path = output_dir / config.OVERVIEW_CONFIG['filename']
+    
+    visualizer.save_multi_currency_html(
+        charts_data=charts_data,
+        output_path=str(output_path),
+        title="FX Trend Dashboard",
+        default_currency=config.DEFAULT_CURRENCY
+    )
+    visualizer.save_overview_html(
+        charts_data=charts_data,
+        output_path=str(overview_path),
+        chart_urls={currency_code: chart_script_url(currency_code) for currency_code in charts_data},
+        title="FX Trend Overview",
+        period_label=f"{config.DEFAULT_PERIOD_YEARS}년",
+        sparkline=config.OVERVIEW_CONFIG['sparkline']
+    )
+    print(f"✓ {len(charts_data)}개 통화 조립 완료: {output_path}, {overview_path}")
+    
+    try:
+        exporter = FXExporter(config.EXPORT_DIR, config.EXPORT_FORMATS)
+        exporter.export_statistics({currency_code: data['statistics'] for currency_code, data in charts_data.items()})
+        print(f"✓ 내보내기 완료: {config.EXPORT_DIR} ({', '.join(config.EXPORT_FORMATS)})")
+    except Exception as e:
+        print(f"! 내보내기 실패: {str(e)}")
+
+
+def run_chunked():
+    """
+    청크 분석 모드: 저장소 전체 이력을 CHUNK_SIZE 단위로 분석해 청크마다 내보내기 (series_full)
+    
+    메모리에 올리는 양이 청크 크기로 제한되므로 메모리보다 큰 이력에도 사용할 수 있다.
+    CHUNK_STORE_DIR에 분봉 등 장중 저장소를 지정하면 봉 단위로 분석한다 (Date 단위는 파일 헤더 기준).
+    """
+    store = FXTimeSeriesStore(config.CHUNK_STORE_DIR, dtype=config.STORE_PRICE_DTYPE)
+    analyzer = FXAnalyzer()
+    exporter = FXExporter(config.EXPORT_DIR, config.EXPORT_FORMATS)
+    ma_periods = {name: info['days'] for name, info in config.MOVING_AVERAGES.items()}
+    
+    for currency_code, currency_info in config.CURRENCIES.items():
+        if not store.exists(currency_code):
+            print(f"  ! {currency_info['name']} 저장소 없음 (먼저 python main.py 실행)")
+            continue
         
+        chunks = store.iter_frames(currency_code, config.CHUNK_SIZE, columns=['Close'])
+        with exporter.open_series_writer(currency_code, list(ma_periods)) as writer:
+            for chunk in analyzer.analyze_trend_chunked(chunks, ma_periods):
+                writer.write(chunk)
+        print(f"  ✓ {currency_info['name']}: {writer.rows}개 레코드")
+    
+    print(f"✓ 청크 분석 완료: {config.EXPORT_DIR} ({', '.join(config.EXPORT_FORMATS)}, {FULL_SERIES_DATASET}/)")
+
+
+def main(live: bool = False):
+    """
+    메인 실행 함수
+    
+    Args:
+        live: True면 페이지 생성 후 실시간 갱신 서버 실행
+    """
+    print("=" * 60)
+    print("FX Trend Dashboard 생성 시작")
+    print("=" * 60)
+    
+    collector = FXDataCollector()
+    store = FXTimeSeriesStore(config.STORE_DIR, dtype=config.STORE_PRICE_DTYPE, time_unit=config.STORE_TIME_UNIT)
+    analyzer = FXAnalyzer()
+    visualizer = FXVisualizer(config.GRAPH_CONFIG)
+    
+    # 이동평균 기간 추출
+    ma_periods = {name: info['days'] for name, info in config.MOVING_AVERAGES.items()}
+    
+    def report_error(stage_name, currency_code, error):
+        name = config.CURRENCIES[currency_code]['name']
+        print(f"    ✗ {name} {STAGE_LABELS[stage_name]} 실패: {str(error)}")
+    
+    # 1. 수집 (통화별 저장소 갱신, 네트워크 I/O를 동시에 실행)
+    print("\n[1/5] 데이터 수집 중...")
+    total_period_years = config.DEFAULT_PERIOD_YEARS + config.MA_WARMUP_YEARS
+    print(f"  - 수집 기간: {total_period_years}년 (표시: {config.DEFAULT_PERIOD_YEARS}년 + 이동평균 계산용: {config.MA_WARMUP_YEARS}년)")
+    
+    fetch_pipeline = FXPipeline(
+        stages=[('fetch', partial(update_store, collector, store), config.PIPELINE_CONFIG['fetch_workers'])],
+        queue_size=config.PIPELINE_CONFIG['queue_size'],
+        on_error=report_error
+    )
+    fetched = fetch_pipeline.run(config.CURRENCIES.items())
+    
+    # 2. 리스크 지표 (전체 통화 패널 벡터화 계산, 저장소 종가 memmap 사용)
+    print("\n[2/5] 리스크 지표 계산 중...")
+    try:
+        risk = calculate_panel_risk(analyzer, store, list(fetched))
+        print(f"✓ 리스크 지표 계산 완료 (변동성 / 최대 낙폭 / VaR, {len(risk)}개 통화)")
     except Exception as e:
-        import traceback
-        print(f"✗ 시각화 실패: {str(e)}")
-        print("\n상세 오류:")
-        traceback.print_exc()
-        return
+        risk = {}
+        print(f"! 리스크 지표 계산 실패: {str(e)}")
     
-    # 4. 다중 통화 HTML 파일 저장
-    print("\n[4/4] HTML 파일 저장 중...")
+    # 3~5. 로드 → 분석 → 그래프 생성 → 내보내기 / HTML 기록 (통화별로 겹쳐서 실행)
+    print("\n[3-5/5] 분석 / 그래프 생성 / 저장 중...")
+    pipeline = FXPipeline(
+        stages=[
+            ('load', partial(load_history, store), 1),
+            ('analyze', partial(analyze_currency, analyzer, ma_periods, risk), config.PIPELINE_CONFIG['analyze_workers']),
+            ('render', partial(render_currency, visualizer), config.PIPELINE_CONFIG['render_workers'])
+        ],
+        queue_size=config.PIPELINE_CONFIG['queue_size'],
+        on_error=report_error
+    )
     
     # 출력 디렉토리 생성
     output_dir = Path(config.OUTPUT_DIR)
     output_dir.mkdir(exist_ok=True)
     
     output_path = output_dir / config.OUTPUT_FILENAME
+    overview_path = output_dir / config.OVERVIEW_CONFIG['filename']
+    exporter = FXExporter(config.EXPORT_DIR, config.EXPORT_FORMATS)
     
+    # 렌더링이 끝난 통화부터 바로 페이지/내보내기 파일에 기록하고, 이후에는 통계와
+    # (실시간 모드의) 가격 이력만 유지한다
+    statistics = {}
+    live_data = {}
+    export_failed = False
+    no_charts = False
     try:
-        visualizer.save_multi_currency_html(
-            charts_data=charts_data,
+        with visualizer.open_multi_currency_html(
             output_path=str(output_path),
+            currencies=config.CURRENCIES,
             title="FX Trend Dashboard",
-            default_currency=config.DEFAULT_CURRENCY
-        )
-        print(f"✓ HTML 파일 저장 완료: {output_path}")
+            default_currency=config.DEFAULT_CURRENCY,
+            live_url=f"ws://{config.LIVE_CONFIG['host']}:{config.LIVE_CONFIG['port']}" if live else None
+        ) as write_page, visualizer.open_overview_html(
+            output_path=str(overview_path),
+            title="FX Trend Overview",
+            period_label=f"{config.DEFAULT_PERIOD_YEARS}년",
+            sparkline=config.OVERVIEW_CONFIG['sparkline']
+        ) as write_overview:
+            for currency_code, data in pipeline.iter_results(fetched.items()):
+                write_page(currency_code, data)
+                
+                # 개요 행 + 클릭 시 로드할 통화별 차트 스크립트
+                chart_url = chart_script_url(currency_code)
+                visualizer.save_chart_script(currency_code, data, str(output_dir / chart_url))
+                write_overview(currency_code, data, chart_url)
+                
+                # 분석 결과 내보내기 (Arrow IPC / Parquet)
+                try:
+                    exporter.export_series(currency_code, data['df'], list(ma_periods))
+                except Exception as e:
+                    export_failed = True
+                    print(f"    ! {data['info']['name']} 내보내기 실패: {str(e)}")
+                
+                statistics[currency_code] = data['statistics']
+                if live:
+                    live_data[currency_code] = {
+                        'statistics': data['statistics'],
+                        'df': data['df'][['Date', 'Close']].reset_index(drop=True)
+                    }
+                
+                print(f"    ✓ {data['info']['name']} 페이지 기록 완료")
+            
+            if not statistics:
+                # 기존 페이지를 빈 페이지로 교체하지 않도록 임시 파일 폐기
+                no_charts = True
+                raise RuntimeError("생성된 그래프가 없습니다.")
     except Exception as e:
+        if no_charts:
+            print("\n✗ 생성된 그래프가 없습니다.")
+            return
         import traceback
-        print(f"✗ HTML 저장 실패: {str(e)}")
+        print(f"\n✗ HTML 저장 실패: {str(e)}")
         traceback.print_exc()
         return
     
+    print(f"\n✓ 총 {len(statistics)}개 통화 그래프 생성 완료")
+    print(f"✓ HTML 파일 저장 완료: {output_path}")
+    print(f"✓ 개요 페이지 저장 완료: {overview_path}")
+    
+    try:
+        exporter.export_statistics(statistics)
+        if not export_failed:
+            print(f"✓ 내보내기 완료: {config.EXPORT_DIR} ({', '.join(config.EXPORT_FORMATS)})")
+    except Exception as e:
+        print(f"! 내보내기 실패: {str(e)}")
+    
     print("\n" + "=" * 60)
     print("✓ FX Trend Dashboard 생성 완료!")
     print("=" * 60)
     print(f"\n생성된 파일: {output_path}")
     print(f"브라우저에서 열어 확인하세요.")
+    
+    if live:
+        try:
+            asyncio.run(serve_live(collector, store, analyzer, ma_periods, live_data))
+        except KeyboardInterrupt:
+            print("\n✓ 실시간 갱신 서버 종료")
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='FX Trend Dashboard 생성')
+    parser.add_argument('--live', action='store_true', help='페이지 생성 후 WebSocket 실시간 갱신 서버 실행')
+    parser.add_argument('--worker', action='store_true', help='분산 워커 모드 (lease를 얻은 통화쌍만 처리)')
+    parser.add_argument('--assemble', action='store_true', help='워커가 만든 조각으로 페이지 조립')
+    parser.add_argument('--chunked', action='store_true', help='저장소 이력을 청크 단위로 분석해 내보내기')
+    parser.add_argument('--run-id', default=None, help='워커/조립 실행 식별자 (기본: 워커는 새 실행, 조립은 가장 최근 실행)')
+    args = parser.parse_args()
+    
+    if args.worker:
+        run_worker(args.run_id)
+    elif args.assemble:
+        run_assembler(args.run_id)
+    elif args.chunked:
+        run_chunked()
+    else:
+        main(live=args.live)
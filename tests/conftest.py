@@ -0,0 +1,9 @@
+"""
+테스트 공통 설정
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가 (main.py와 동일)
+sys.path.insert(0, str(Path(__file__).parent.parent))
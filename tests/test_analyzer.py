@@ -0,0 +1,35 @@
+"""
+분석 모듈 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.src.analyzer import FXAnalyzer
+import backend.config as config
+
+
+@pytest.fixture
+def prices():
+    """분봉 형태의 테스트 데이터 (가장 긴 이동평균 기간보다 충분히 길게)"""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2020-01-01', periods=5000, freq='min')
+    return pd.DataFrame({'Date': dates, 'Close': 1200 + np.cumsum(rng.normal(0, 0.3, len(dates)))})
+
+
+@pytest.mark.parametrize('chunk_size', [7, 60, 749, 750, 1000, 4999, 10000])
+def test_analyze_trend_chunked_matches_analyze_trend(prices, chunk_size):
+    """청크 분석 결과가 전체 데이터 analyze_trend와 같다 (최대 이동평균 기간보다 작은 청크 포함)"""
+    analyzer = FXAnalyzer()
+    ma_periods = {name: info['days'] for name, info in config.MOVING_AVERAGES.items()}
+    columns = list(ma_periods) + ['daily_change', 'cumulative_change']
+    
+    expected = analyzer.analyze_trend(prices, ma_periods)
+    chunks = (prices.iloc[start:start + chunk_size] for start in range(0, len(prices), chunk_size))
+    result = pd.concat(analyzer.analyze_trend_chunked(chunks, ma_periods))
+    
+    assert len(result) == len(expected)
+    pd.testing.assert_series_equal(result['Date'], expected['Date'])
+    for column in columns:
+        np.testing.assert_allclose(result[column].to_numpy(), expected[column].to_numpy(), rtol=1e-12, atol=0)
@@ -0,0 +1,104 @@
+"""
+시각화 모듈 테스트
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+import pytest
+
+from backend.src.analyzer import FXAnalyzer
+from frontend.src.visualizer import FXVisualizer
+import backend.config as config
+
+
+@pytest.fixture
+def analyzed():
+    """분석된 테스트 데이터와 통계"""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2020-01-01', periods=400)
+    df = pd.DataFrame({'Date': dates, 'Close': 1200 + np.cumsum(rng.normal(0, 3, len(dates)))})
+    
+    analyzer = FXAnalyzer()
+    ma_periods = {name: info['days'] for name, info in config.MOVING_AVERAGES.items()}
+    df = analyzer.analyze_trend(df, ma_periods)
+    return df, analyzer.get_statistics(df)
+
+
+def _both_json(df, statistics, ma_config):
+    """graph_objects 차트와 스펙 dict의 Plotly JSON (키 순서 무관하게 비교하도록 파싱)"""
+    visualizer = FXVisualizer(config.GRAPH_CONFIG)
+    kwargs = dict(
+        df=df,
+        currency_name='미국 달러',
+        currency_symbol='USD/KRW',
+        ma_config=ma_config,
+        statistics=statistics
+    )
+    fig = visualizer.create_trend_chart(**kwargs)
+    spec = visualizer.create_trend_chart_spec(**kwargs)
+    return json.loads(pio.to_json(fig)), json.loads(pio.to_json(spec, validate=False))
+
+
+def test_spec_matches_figure(analyzed):
+    """스펙 dict가 graph_objects 차트와 같은 JSON을 만든다"""
+    df, statistics = analyzed
+    fig_json, spec_json = _both_json(df, statistics, config.MOVING_AVERAGES)
+    assert spec_json == fig_json
+
+
+def test_spec_matches_figure_with_missing_ma(analyzed):
+    """데이터프레임에 없는 이동평균 컬럼은 두 방식 모두 건너뛴다"""
+    df, statistics = analyzed
+    df = df.drop(columns=['MA3Y'])
+    fig_json, spec_json = _both_json(df, statistics, config.MOVING_AVERAGES)
+    assert spec_json == fig_json
+    assert '3년 이동평균' not in [trace['name'] for trace in spec_json['data']]
+
+
+def test_spec_reuses_cached_skeletons(analyzed):
+    """캐시된 트레이스 골격을 재사용해도 결과가 같다"""
+    df, statistics = analyzed
+    first = _both_json(df, statistics, config.MOVING_AVERAGES)
+    visualizer = FXVisualizer(config.GRAPH_CONFIG)
+    kwargs = dict(
+        df=df,
+        currency_name='미국 달러',
+        currency_symbol='USD/KRW',
+        ma_config=config.MOVING_AVERAGES,
+        statistics=statistics
+    )
+    visualizer.create_trend_chart_spec(**kwargs)
+    second = json.loads(pio.to_json(visualizer.create_trend_chart_spec(**kwargs), validate=False))
+    assert second == first[0]
+
+
+def test_fragment_round_trip_keeps_overview_inputs(analyzed, tmp_path):
+    """워커 조각에서 복원한 통계/종가로 만든 개요 행이 원본과 같다"""
+    df, statistics = analyzed
+    visualizer = FXVisualizer(config.GRAPH_CONFIG)
+    data = {
+        'figure': visualizer.create_trend_chart_spec(
+            df=df,
+            currency_name='미국 달러',
+            currency_symbol='USD/KRW',
+            ma_config=config.MOVING_AVERAGES,
+            statistics=statistics
+        ),
+        'summary': visualizer.create_summary_html(statistics=statistics, currency_name='미국 달러'),
+        'info': {'name': '미국 달러', 'symbol': 'USD/KRW'},
+        'statistics': statistics,
+        'df': df
+    }
+    path = tmp_path / 'USD_KRW.json'
+    visualizer.save_currency_fragment('USD/KRW', data, str(path))
+    loaded = visualizer.load_currency_fragment(str(path))
+    
+    assert loaded['info'] == data['info']
+    assert loaded['statistics']['max']['date'] == statistics['max']['date']
+    assert (
+        visualizer.create_overview_row('USD/KRW', loaded, 'charts/USD_KRW.js')
+        == visualizer.create_overview_row('USD/KRW', data, 'charts/USD_KRW.js')
+    )